@@ -15,9 +15,12 @@ Usage:
 """
 
 import argparse
+import atexit
+import re
 import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
 
 # ANSI color codes
 COLOR_RESET = "\033[0m"
@@ -49,8 +52,54 @@ EXCLUDE_PATTERNS = [
     ".venv",
     "*.egg-info",
     "*.o",
+    "*.d",
+    "*.so",
+    "*.a",
+    "build/",
+    # Locally built binary
+    "/thermo-cli/thermo-cli",
 ]
 
+# SSH connection multiplexing: every ssh/rsync call reuses one persistent
+# master connection instead of paying a full handshake per command.
+# %C expands to a short hash of the connection parameters, which keeps the
+# socket path below the UNIX socket length limit.
+SSH_CONTROL_PATH = "/tmp/ssh-cm-%C"
+SSH_CONTROL_PERSIST = "600s"
+SSH_MUX_OPTS = [
+    "-o", "ControlMaster=auto",
+    "-o", f"ControlPath={SSH_CONTROL_PATH}",
+    "-o", f"ControlPersist={SSH_CONTROL_PERSIST}",
+]
+
+# Transport tuning for the connection: a cheap AEAD cipher and no SSH-level
+# compression keep CPU usage low on the Pi. Applied when the master connection
+# is opened, since multiplexed sessions inherit its transport.
+SSH_TRANSPORT_OPTS = [
+    "-o", "Compression=no",
+    "-c", "aes128-gcm@openssh.com",
+]
+
+# Exit code of the remote build script when only the final
+# `thermo-cli --version` check fails
+VERIFY_FAILED_EXIT_CODE = 3
+
+# rsync compression used when both ends support zstd (rsync >= 3.2);
+# level 1 keeps the Pi's CPU out of the way. Without zstd, no compression.
+RSYNC_ZSTD_OPTS = ["-z", "--compress-choice=zstd", "--compress-level=1"]
+
+# Probed rsync compression options per host, so each deploy probes once
+_rsync_compression_cache: dict[str, list[str]] = {}
+
+
+def rsync_supports_zstd(version_output: str) -> bool:
+    """Check `rsync --version` output for version 3.2+ built with zstd."""
+    match = re.search(r"version\s+(\d+)\.(\d+)", version_output)
+    if not match:
+        return False
+    version = (int(match.group(1)), int(match.group(2)))
+    return version >= (3, 2) and "zstd" in version_output
+
 
 def to_remote_path(path: str) -> str:
     """
@@ -77,88 +126,218 @@ def run_cmd(cmd: list[str], check: bool = True, capture: bool = False) -> subpro
     )
 
 
-def run_ssh(host: str, command: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a command on the remote host via SSH."""
-    return run_cmd(["ssh", host, command], check=check)
+class RemoteHost:
+    """
+    A remote host reached over one persistent SSH master connection.
+
+    Every ssh command and rsync transfer goes through this class, so the
+    connection multiplexing and transport tuning are configured in one place.
+    """
 
+    def __init__(self, host: str):
+        self.host = host
 
-def sync_files(host: str, remote_path: str) -> None:
+    def _control_cmd(self, operation: str) -> list[str]:
+        """Build an `ssh -O <operation>` command for the master connection."""
+        return ["ssh", "-o", f"ControlPath={SSH_CONTROL_PATH}", "-O", operation, self.host]
+
+    def start(self) -> None:
+        """Open the master connection that later ssh/rsync calls reuse."""
+        check = subprocess.run(self._control_cmd("check"), capture_output=True)
+        if check.returncode == 0:
+            # A master from a previous deployment is still alive
+            return
+
+        run_cmd([
+            "ssh", "-f", "-N",
+            *SSH_TRANSPORT_OPTS,
+            "-o", "ControlMaster=yes",
+            "-o", f"ControlPath={SSH_CONTROL_PATH}",
+            "-o", f"ControlPersist={SSH_CONTROL_PERSIST}",
+            self.host,
+        ])
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Shut down the master connection."""
+        subprocess.run(self._control_cmd("exit"), capture_output=True)
+
+    def ssh(self, command: str, check: bool = True) -> subprocess.CompletedProcess:
+        """Run a command on the remote host."""
+        return run_cmd(["ssh", *SSH_MUX_OPTS, self.host, command], check=check)
+
+    def ssh_script(self, script: str, check: bool = True) -> subprocess.CompletedProcess:
+        """Run a shell script on the remote host in a single SSH session (fed via stdin)."""
+        print(f"{COLOR_CYAN}[CMD]{COLOR_RESET} ssh {self.host} bash -s")
+        for line in script.splitlines():
+            print(f"      {line}")
+        return subprocess.run(
+            ["ssh", *SSH_MUX_OPTS, self.host, "bash -s"],
+            input=script,
+            check=check,
+            text=True,
+        )
+
+    def rsync_compression_options(self) -> list[str]:
+        """Return rsync compression options supported by both ends (probed once)."""
+        if self.host not in _rsync_compression_cache:
+            local = subprocess.run(["rsync", "--version"], capture_output=True, text=True)
+            remote = subprocess.run(
+                ["ssh", *SSH_MUX_OPTS, self.host, "rsync --version"],
+                capture_output=True,
+                text=True,
+            )
+            both_zstd = rsync_supports_zstd(local.stdout) and rsync_supports_zstd(remote.stdout)
+            _rsync_compression_cache[self.host] = RSYNC_ZSTD_OPTS if both_zstd else []
+        return _rsync_compression_cache[self.host]
+
+    def rsync(
+        self, sources: list[str], remote_path: str, options: list[str], manifest: Optional[bytes] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Copy local sources into remote_path with rsync over the master connection.
+
+        remote_path is created on the remote side by the same session that
+        starts the rsync server. If manifest is given it is fed to rsync's
+        stdin (for --files-from=-).
+        """
+        ssh_cmd = " ".join(["ssh", "-T", *SSH_TRANSPORT_OPTS, *SSH_MUX_OPTS])
+        cmd = [
+            "rsync",
+            *options,
+            "-e", ssh_cmd,
+            "--rsync-path", f"mkdir -p {remote_path} && rsync",
+            *sources,
+            f"{self.host}:{remote_path}/",
+        ]
+        if manifest is None:
+            return run_cmd(cmd)
+
+        print(f"{COLOR_CYAN}[CMD]{COLOR_RESET} {' '.join(cmd)}")
+        return subprocess.run(cmd, input=manifest, check=True)
+
+
+def git_file_manifest() -> Optional[bytes]:
+    """
+    List the files under SYNC_ITEMS known to git, NUL-separated for rsync --from0.
+
+    Untracked files that are not ignored are included so new sources are
+    synced before they are committed. Returns None outside a git checkout or
+    when git is not available.
+    """
+    if not (PROJECT_ROOT / ".git").exists():
+        return None
+
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(PROJECT_ROOT), "ls-files", "-z", "--cached", "--others",
+             "--exclude-standard", "--", *SYNC_ITEMS],
+            capture_output=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+
+    # Drop tracked files that were deleted from the working tree
+    paths = [p for p in result.stdout.split(b"\0") if p and (PROJECT_ROOT / p.decode()).exists()]
+    return b"".join(p + b"\0" for p in paths)
+
+
+def sync_files(remote: RemoteHost, remote_path: str) -> None:
     """Sync project files to the remote host using rsync."""
     print(f"\n{COLOR_BOLD}{COLOR_BLUE}=== Syncing files to remote ==={COLOR_RESET}")
 
-    # Build rsync command
-    rsync_cmd = [
-        "rsync",
-        "-avz",
-        "--progress",
-        "--delete",
+    # Whole-file in-place transfers, which are faster than delta transfers
+    # for a small source tree; compressed with zstd only if both ends have it
+    options = [
+        "-rlptDW",
+        "--inplace",
+        "--numeric-ids",
+        "--info=progress2",
+        *remote.rsync_compression_options(),
     ]
 
     # Add exclude patterns
     for pattern in EXCLUDE_PATTERNS:
-        rsync_cmd.extend(["--exclude", pattern])
-
-    # Add source files
+        options.extend(["--exclude", pattern])
+
+    # Inside a git checkout, send an explicit file list instead of letting
+    # rsync walk the directories (and any build output left in them).
+    # --delete has no effect with a file list, since no directory is sent
+    # whole, so remote files dropped from the manifest are left in place.
+    manifest = git_file_manifest()
+    if manifest is not None:
+        options.extend(["--from0", "--files-from=-"])
+        remote.rsync([f"{PROJECT_ROOT}/"], remote_path, options, manifest=manifest)
+        return
+
+    # Collect source files
+    sources = []
     for item in SYNC_ITEMS:
         src = PROJECT_ROOT / item
         if src.exists():
-            rsync_cmd.append(str(src))
+            sources.append(str(src))
         else:
             print(f"{COLOR_YELLOW}[WARN]{COLOR_RESET} {item} not found, skipping")
 
-    # Add destination
-    rsync_cmd.append(f"{host}:{remote_path}/")
+    options.append("--delete")
+    remote.rsync(sources, remote_path, options)
 
-    run_cmd(rsync_cmd)
 
-
-def install_dependencies(host: str, password: str, remote_path: str) -> None:
+def install_dependencies(remote: RemoteHost, password: str, remote_path: str) -> None:
     """Install build dependencies on the remote host using install_deps.sh."""
     print(f"\n{COLOR_BOLD}{COLOR_BLUE}=== Installing dependencies ==={COLOR_RESET}")
     
     # Run the install_deps.sh script
     print(f"{COLOR_BLUE}[INFO]{COLOR_RESET} Running install_deps.sh on remote host...")
-    run_ssh(host, f"cd {remote_path} && echo '{password}' | sudo -S bash install_deps.sh")
+    remote.ssh(f"cd {remote_path} && echo '{password}' | sudo -S bash install_deps.sh")
 
 
-def build_on_remote(host: str, remote_path: str, debug: bool = False) -> None:
-    """Build the C project on the remote host."""
+def build_and_install_on_remote(
+    remote: RemoteHost, remote_path: str, password: Optional[str] = None, debug: bool = False
+) -> None:
+    """
+    Build the C project on the remote host and install it if a password is given.
+
+    All steps run as one script in a single SSH session instead of one
+    session per command.
+    """
     build_mode = "DEBUG" if debug else "RELEASE"
-    print(f"\n{COLOR_BOLD}{COLOR_BLUE}=== Building thermo-cli ({build_mode} mode) ==={COLOR_RESET}")
-    
-    # Clean previous build
-    print(f"{COLOR_BLUE}[INFO]{COLOR_RESET} Cleaning previous build...")
-    run_ssh(host, f"cd {remote_path}/thermo-cli && make clean", check=False)
-    
-    # Build project
-    build_cmd = f"cd {remote_path}/thermo-cli && make"
-    if debug:
-        build_cmd += " DEBUG=1"
-    print(f"{COLOR_BLUE}[INFO]{COLOR_RESET} Building project with: {build_cmd}")
-    run_ssh(host, build_cmd)
+    install = password is not None
+    title = "Building and installing" if install else "Building"
+    print(f"\n{COLOR_BOLD}{COLOR_BLUE}=== {title} thermo-cli ({build_mode} mode) ==={COLOR_RESET}")
+
+    build_cmd = "make DEBUG=1" if debug else "make"
+    script = [
+        "set -euo pipefail",
+        f"cd {remote_path}/thermo-cli",
+        # Clean previous build
+        "make clean || true",
+        build_cmd,
+    ]
+    if install:
+        script += [
+            # Install to /usr/local/bin
+            f"echo '{password}' | sudo -S make install",
+            # Verify installation
+            f"thermo-cli --version || exit {VERIFY_FAILED_EXIT_CODE}",
+        ]
 
+    result = remote.ssh_script("\n".join(script) + "\n", check=False)
 
-def install_on_remote(host: str, password: str, remote_path: str) -> None:
-    """Install the thermo-cli binary on the remote host."""
-    print(f"\n{COLOR_BOLD}{COLOR_BLUE}=== Installing thermo-cli ==={COLOR_RESET}")
-    
-    # Install to /usr/local/bin
-    run_ssh(host, f"cd {remote_path}/thermo-cli && echo '{password}' | sudo -S make install")
-    
-    # Verify installation
-    print(f"\n{COLOR_BOLD}{COLOR_BLUE}=== Verifying installation ==={COLOR_RESET}")
-    result = run_ssh(host, "thermo-cli --version", check=False)
-    
-    if result.returncode == 0:
-        print(f"{COLOR_GREEN}[SUCCESS]{COLOR_RESET} thermo-cli installed successfully!")
-    else:
+    if result.returncode == VERIFY_FAILED_EXIT_CODE and install:
         print(f"{COLOR_YELLOW}[WARN]{COLOR_RESET} Installation verification failed")
+    elif result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, result.args)
+    elif install:
+        print(f"{COLOR_GREEN}[SUCCESS]{COLOR_RESET} thermo-cli installed successfully!")
 
 
-def setup_remote_directory(host: str, remote_path: str) -> None:
+def setup_remote_directory(remote: RemoteHost, remote_path: str) -> None:
     """Create the remote directory if it doesn't exist."""
     print(f"\n{COLOR_BOLD}{COLOR_BLUE}=== Setting up remote directory: {remote_path} ==={COLOR_RESET}")
-    run_ssh(host, f"mkdir -p {remote_path}")
+    remote.ssh(f"mkdir -p {remote_path}")
 
 
 def main():
@@ -240,12 +419,15 @@ Examples:
     print(f"Project root: {PROJECT_ROOT}")
 
     try:
-        # Setup remote directory
-        setup_remote_directory(args.host, args.remote_path)
+        # Open the shared SSH connection used by all following steps
+        remote = RemoteHost(args.host)
+        remote.start()
 
-        # Sync files
-        if not args.no_sync:
-            sync_files(args.host, args.remote_path)
+        # Sync files (rsync creates the remote directory itself)
+        if args.no_sync:
+            setup_remote_directory(remote, args.remote_path)
+        else:
+            sync_files(remote, args.remote_path)
 
         if args.sync_only:
             print(f"\n{COLOR_BOLD}{COLOR_GREEN}=== Sync complete (--sync-only) ==={COLOR_RESET}")
@@ -253,19 +435,21 @@ Examples:
 
         # Install dependencies
         if not args.no_deps and not args.update:
-            install_dependencies(args.host, args.password, args.remote_path)
+            install_dependencies(remote, args.password, args.remote_path)
 
-        # Build project
-        build_on_remote(args.host, args.remote_path, args.debug)
+        # Build project (and install binary unless --build-only)
+        build_and_install_on_remote(
+            remote,
+            args.remote_path,
+            password=None if args.build_only else args.password,
+            debug=args.debug,
+        )
 
         if args.build_only:
             print(f"\n{COLOR_BOLD}{COLOR_GREEN}=== Build complete (--build-only) ==={COLOR_RESET}")
             print(f"To install, run: ssh {args.host} 'cd {args.remote_path} && sudo make install'")
             return
 
-        # Install binary
-        install_on_remote(args.host, args.password, args.remote_path)
-
         print(f"\n{COLOR_BOLD}{COLOR_GREEN}=== Deployment complete! ==={COLOR_RESET}")
         print(f"Run: ssh {args.host} thermo-cli --help")
         print(f"Test: ssh {args.host} thermo-cli list")
@@ -1,20 +1,34 @@
-from typing import Generator, Optional, NamedTuple
+from typing import Callable, Generator, Optional
 
 import typer
 
 import traceback
 import subprocess
+import threading
 import time
-import select
 import atexit
 
+import csv
 import math
 import json
-from pathlib import Path
 from collections import deque
+from operator import itemgetter
+from datetime import datetime
+from pathlib import Path
 
 import numpy as np
-from scipy.ndimage import gaussian_filter1d
+
+# orjson parses the fuse output (bytes) considerably faster; fall back to json
+try:
+    from orjson import loads as json_loads, dumps as orjson_dumps
+
+    def json_dumps(obj) -> str:
+        return orjson_dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
 
 
 READ_COMMAND = [
@@ -28,7 +42,12 @@ READ_COMMAND = [
     "-s",
     "1",
 ]
+# Most recent thermo-cli stderr lines kept for reporting
+STDERR_LINES = 200
 TERMINATE_COMMAND = ["cmg-cli", "set", "--idle"]
+# Seconds to wait for one terminate attempt, and the cap on the retry delay
+TERMINATE_TIMEOUT = 5
+TERMINATE_MAX_DELAY = 10
 WHEEL_ON_COMMAND = ["cmg-cli", "set", "--wheel"]
 
 KEYS_TO_CHECK_THRESHOLD = [
@@ -46,9 +65,33 @@ KEYS_TO_CHECK_STEADY = [
     "THERMO_PLATE_TEMP",
 ]
 
+# Write buffer for data.csv and log.txt; rows are flushed in batches
+LOG_BUFFER_SIZE = 1 << 16
+# Value types data.csv rows may be %-formatted from without csv quoting
+NUMERIC_TYPES = frozenset((int, float))
+
+
+def tuple_getter(keys: list) -> Callable[[dict], tuple]:
+    # itemgetter with one key returns the bare value, and needs at least one
+    if len(keys) == 0:
+        return lambda d: ()
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda d: (d[key],)
+    return itemgetter(*keys)
+
 
 class Logger:
-    def __init__(self, name: str, output_append: bool = False):
+    def __init__(
+        self,
+        name: str,
+        output_append: bool = False,
+        pretty: bool = False,
+        log_every: int = 1,
+        quiet: bool = False,
+        flush_every: int = 30,
+        flush_interval: float = 5.0,
+    ):
         output_dir = Path("output") / name
         if not output_dir.exists():
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -58,9 +101,27 @@ class Logger:
         meta_path = output_dir / "meta.toml"
 
         self.meta_file = open(meta_path, "w")
-        self.log_file = open(log_path, "w")
-        self.output_file = open(output_path, "a" if output_append else "w")
+        self.log_file = open(log_path, "w", buffering=LOG_BUFFER_SIZE)
+        self.output_file = open(
+            output_path, "a" if output_append else "w", newline="", buffering=LOG_BUFFER_SIZE
+        )
         self.output_append = output_append
+        self.pretty = pretty
+        # log.txt keeps every log_every-th row; data.csv keeps all of them
+        self.log_every = max(log_every, 1)
+        # quiet: rows go to data.csv only
+        self.quiet = quiet
+        # Files are flushed every flush_every rows or flush_interval seconds,
+        # whichever comes first, rather than on every row
+        self.flush_every = max(flush_every, 1)
+        self.flush_interval = flush_interval
+        self.last_flush = time.monotonic()
+        self.rows = 0
+
+        self.csv_writer = csv.writer(self.output_file, lineterminator="\n")
+        self.columns = None
+        self.row_values = None
+        self.warned_mismatch = False
     
     def write_meta(self, meta: dict):
         for key, value in meta.items():
@@ -68,84 +129,312 @@ class Logger:
         self.meta_file.flush()
     
     def log_columns(self, columns: dict):
+        # Fix the column order once; rows are extracted with a single getter
+        self.columns = list(columns.keys())
+        self.row_values = tuple_getter(self.columns)
+
+        # Numeric rows are written with one %-format; str(float) is what csv writes too
+        numeric = NUMERIC_TYPES.issuperset(map(type, self.row_values(columns)))
+        self.row_format = ",".join(["%s"] * len(self.columns)) + "\n" if numeric else None
+
+        # --pretty block as one positional format template over the row values;
+        # without a TIME column every row is built from the row itself instead
+        self.pretty_template = None
+        if "TIME" in self.columns:
+            lines = [f"Timestamp: {{{self.columns.index('TIME')}}}"]
+            lines += [
+                f"  {key.replace('{', '{{').replace('}', '}}')}: {{{index}}}"
+                for index, key in enumerate(self.columns)
+                if key != "TIME"
+            ]
+            self.pretty_template = "\n".join(lines) + "\n\n"
         if not self.output_append:
-            self.output_file.write(",".join(columns.keys()) + "\n")
+            self.csv_writer.writerow(self.columns)
     
     def log_row(self, row: dict):
-        self.output_file.write(",".join(str(row[col]) for col in row.keys()) + "\n")
-        self.output_file.flush()
+        if self.row_values is None:
+            self.log_columns(row)
+        matched = len(row) == len(self.columns)
+        if matched:
+            try:
+                values = self.row_values(row)
+            except KeyError:
+                matched = False
+        if not matched:
+            # Keys differ from the header: missing columns are left empty and
+            # keys that are not in the header cannot be written to data.csv
+            if not self.warned_mismatch:
+                self.warned_mismatch = True
+                extra = [key for key in row if key not in self.columns]
+                print(
+                    "Warning: row keys differ from the data.csv header"
+                    + (f"; not written: {', '.join(extra)}" if extra else "")
+                )
+            values = [row.get(column) for column in self.columns]
+            self.csv_writer.writerow(values)
+        elif self.row_format is not None and NUMERIC_TYPES.issuperset(map(type, values)):
+            self.output_file.write(self.row_format % values)
+        else:
+            # csv handles quoting (strings may hold commas, quotes or newlines)
+            # and writes None (JSON null) as an empty field
+            self.csv_writer.writerow(values)
+
+        if not self.quiet and self.rows % self.log_every == 0:
+            if self.pretty and matched and self.pretty_template is not None:
+                self.log_file.write(self.pretty_template.format(*values))
+            elif self.pretty:
+                # Row with other keys or no TIME: build the block from the row itself
+                lines = [f"Timestamp: {row.get('TIME')}"]
+                lines += [f"  {key}: {value}" for key, value in row.items() if key != "TIME"]
+                self.log_file.write("\n".join(lines) + "\n\n")
+            else:
+                # One compact JSON object per line
+                self.log_file.write(json_dumps(row) + "\n")
 
-        self.log_file.write(f"Timestamp: {row['TIME']}\n")
-        for key in row.keys():
-            if key != "TIME":
-                self.log_file.write(f"  {key}: {row[key]}\n")
-        self.log_file.write("\n")
+        self.rows += 1
+        if (
+            self.rows % self.flush_every == 0
+            or time.monotonic() - self.last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        self.output_file.flush()
         self.log_file.flush()
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        for file in (self.output_file, self.log_file, self.meta_file):
+            if not file.closed:
+                file.close()
 
 class Reader:
     def __init__(self):
         self.columns = None
         self.lines = 0
 
+        # Column names per input key, built once per distinct key
+        self.power_keys: dict[str, str] = {}
+        self.thermo_keys: dict[str, dict[str, str]] = {}
+
+        # Extractor specialized to the schema of the first row
+        self.extract: Optional[Callable[[dict], Optional[dict]]] = None
+
     def __timestamp_to_seconds(self, ts: str) -> float:
-        # Format: YEAR-MONTH-DAYTHOUR:MINUTE:SECOND.MICROSECOND
-        date, time = ts.split("T")
-        year, month, day = map(int, date.split("-"))
-        hour, minute, second = map(float, time.split(":"))
-        second, microsecond = map(int, str(second).split("."))
-        total_seconds = (
-            (((year * 365 + month * 30 + day) * 24 + hour) * 60 + minute) * 60
-            + second
-            + microsecond / 1_000_000
-        )
-        return total_seconds
+        # Format: YEAR-MONTH-DAYTHOUR:MINUTE:SECOND.MICROSECOND (local time)
+        return datetime.fromisoformat(ts).timestamp()
+
+    def __compile(self, data: dict) -> Callable[[dict], Optional[dict]]:
+        """
+        Build a row extractor for the POWER/THERMOCOUPLE layout of `data`.
+        It returns None when a row does not match that layout.
+        """
+        power = data["POWER"]
+        power_count = len(power)
+        power_values = tuple_getter(list(power))
+        names = ["TIME"] + [f"POWER_{key}" for key in power]
 
-    def __parse(self, line: str) -> dict:
-        data = json.loads(line)
+        thermo = data["THERMOCOUPLE"]
+        thermo_count = len(thermo)
+        thermo_plan = []
+        for pos, readings in thermo.items():
+            thermo_plan.append((pos, len(readings), tuple_getter(list(readings))))
+            names += [f"THERMO_{pos}_{key}" for key in readings]
+
+        timestamp_to_seconds = self.__timestamp_to_seconds
+
+        def extract(data: dict) -> Optional[dict]:
+            power = data["POWER"]
+            thermo = data["THERMOCOUPLE"]
+            if len(power) != power_count or len(thermo) != thermo_count:
+                return None
+
+            values = [timestamp_to_seconds(data["TIMESTAMP"])]
+            values += power_values(power)
+            for pos, count, readings_values in thermo_plan:
+                readings = thermo[pos]
+                if len(readings) != count:
+                    return None
+                values += readings_values(readings)
+            return dict(zip(names, values))
+
+        return extract
+
+    def __parse(self, line: bytes) -> dict:
+        data = json_loads(line)
+
+        if self.extract is not None:
+            try:
+                row = self.extract(data)
+            except KeyError:
+                row = None
+            if row is not None:
+                return row
+
+        # First row or changed layout: generic walk, then specialize on this row
+        self.extract = self.__compile(data)
 
         row = {}
         row["TIME"] = self.__timestamp_to_seconds(data["TIMESTAMP"])
 
-        power = data["POWER"]
-        for key, value in power.items():
-            row[f"POWER_{key}"] = value
-
-        thermo = data["THERMOCOUPLE"]
-        for pos, data in thermo.items():
-            for key, value in data.items():
-                row[f"THERMO_{pos}_{key}"] = value
+        power_keys = self.power_keys
+        for key, value in data["POWER"].items():
+            name = power_keys.get(key)
+            if name is None:
+                name = power_keys[key] = f"POWER_{key}"
+            row[name] = value
+
+        for pos, readings in data["THERMOCOUPLE"].items():
+            pos_keys = self.thermo_keys.get(pos)
+            if pos_keys is None:
+                pos_keys = self.thermo_keys[pos] = {}
+            for key, value in readings.items():
+                name = pos_keys.get(key)
+                if name is None:
+                    name = pos_keys[key] = f"THERMO_{pos}_{key}"
+                row[name] = value
 
         return row
     
-    def __open_proc(self) -> subprocess.Popen:
+    def __open_proc(self) -> tuple[subprocess.Popen, deque, threading.Thread]:
+        # Binary pipes: lines go to the JSON parser as bytes without decoding
         proc = subprocess.Popen(
-            READ_COMMAND, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            READ_COMMAND, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1 << 16
         )
+        # stderr is drained on its own thread so a chatty child never stalls on a full pipe
+        stderr_lines = deque(maxlen=STDERR_LINES)
+        stderr_thread = threading.Thread(
+            target=self.__drain_stderr, args=(proc.stderr, stderr_lines), daemon=True
+        )
+        stderr_thread.start()
+        return proc, stderr_lines, stderr_thread
+
+    @staticmethod
+    def __drain_stderr(stream, lines: deque):
+        for line in stream:
+            lines.append(line.decode(errors="replace").rstrip())
+
+    @staticmethod
+    def __print_stderr(lines: deque):
+        while lines:
+            print(f"thermo-cli: {lines.popleft()}")
 
-        if select.select([proc.stderr], [], [], 0)[0]:
-            err_msgs = []
-            for line in proc.stderr:
-                err_msgs.append(line.strip())
-            raise RuntimeError("Failed to start thermo-cli: \n" + "\n".join(err_msgs))
-    
-        return proc
-        
     def read(self) -> Generator[tuple[int, dict], None, None]:
         while True:
-            proc = self.__open_proc()
-            for line in proc.stdout:
+            proc, stderr_lines, stderr_thread = self.__open_proc()
+            proc_lines = 0
+            for line in iter(proc.stdout.readline, b""):
                 row = self.__parse(line)
                 yield self.lines, row
                 self.lines += 1
-            
-            # Unexpected termination, restart
+                proc_lines += 1
+                if stderr_lines:
+                    self.__print_stderr(stderr_lines)
+
             proc.terminate()
             proc.wait()
+            # A grandchild (cmg-cli) may still hold stderr open; don't wait on it forever
+            stderr_thread.join(timeout=1.0)
+            if proc_lines == 0:
+                raise RuntimeError("Failed to start thermo-cli: \n" + "\n".join(stderr_lines))
+            self.__print_stderr(stderr_lines)
+
+            # Unexpected termination, restart
             print("thermo-cli terminated unexpectedly. Restarting...")
 
-class Device:
-    SteadyEntry = NamedTuple("SteadyEntry", [("time", float), ("value", float)])
+class RunningStats:
+    """Mean and variance of a sliding window, updated in O(1) (Welford)."""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float):
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float):
+        if self.n <= 1:
+            self.__init__()
+            return
+        self.n -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.n
+        self.m2 -= delta * (value - self.mean)
+
+    def std(self) -> float:
+        # Population std like np.std; clamp rounding error below zero
+        return math.sqrt(max(self.m2, 0.0) / self.n) if self.n else 0.0
+
+
+class SteadyHistory:
+    """
+    Sliding window of samples of several series that share their timestamps,
+    kept as a struct of arrays: one times array and one (series x capacity)
+    values array.
+
+    Samples are appended at the tail and dropped by advancing the head, so the
+    window is always one contiguous slice. When the tail reaches the end, the
+    live samples are moved to the front, or the arrays are doubled if they
+    are more than half full.
+    """
+
+    def __init__(self, series: int, capacity: int = 256):
+        self.times = np.empty(capacity, dtype=np.float64)
+        self.values = np.empty((series, capacity), dtype=np.float64)
+        self.head = 0
+        self.tail = 0
+        # Time of the last steady check over this window
+        self.last_check: Optional[float] = None
+
+    def __len__(self) -> int:
+        return self.tail - self.head
+
+    def append(self, time: float, values: tuple):
+        if self.tail == len(self.times):
+            self._make_room()
+        self.times[self.tail] = time
+        self.values[:, self.tail] = values
+        self.tail += 1
+
+    def trim(self, time: float, window: float) -> list[list[float]]:
+        """
+        Drop the samples taken `window` or more seconds before `time`, in one step.
+        Returns the dropped values, one list per series (oldest first).
+        """
+        # Times are non-decreasing, so the kept samples are a suffix
+        keep = time - self.times[self.head:self.tail] < window
+        count = int(np.argmax(keep)) if keep.any() else len(keep)
+        dropped = self.values[:, self.head:self.head + count].tolist()
+        self.head += count
+        return dropped
+
+    def first_time(self) -> float:
+        return self.times[self.head]
+
+    def window(self) -> np.ndarray:
+        """Values currently in the window (a view, one row per series, oldest first)."""
+        return self.values[:, self.head:self.tail]
+
+    def _make_room(self):
+        count = self.tail - self.head
+        if count > len(self.times) // 2:
+            times = np.empty(len(self.times) * 2, dtype=np.float64)
+            values = np.empty((len(self.values), len(self.times) * 2), dtype=np.float64)
+        else:
+            times, values = self.times, self.values
+        times[:count] = self.times[self.head:self.tail]
+        values[:, :count] = self.values[:, self.head:self.tail]
+        self.times, self.values = times, values
+        self.head, self.tail = 0, count
+
 
+class Device:
     def __init__(
         self,
         threshold: float,
@@ -156,17 +445,22 @@ class Device:
     ):
         self.terminated = False
         self.threshold = threshold
+        self.threshold_getter = itemgetter(*KEYS_TO_CHECK_THRESHOLD)
 
         self.steady_window = steady_window
         self.steady_sigma = steady_sigma
         self.steady_threshold = steady_threshold
         self.steady_check_every = steady_check_every
 
-        self.steady_history = {key: deque() for key in KEYS_TO_CHECK_STEADY}
-        self.steady_last_check = {key: None for key in KEYS_TO_CHECK_STEADY}
+        # Steady state is tracked per key position in KEYS_TO_CHECK_STEADY
+        self.steady_values = itemgetter(*KEYS_TO_CHECK_STEADY)
+
+        # All steady keys are sampled together, so they share one history
+        self.steady_history = SteadyHistory(len(KEYS_TO_CHECK_STEADY))
+        self.steady_stats = [RunningStats() for _ in KEYS_TO_CHECK_STEADY]
 
-        self.init_steady_history = {key: deque() for key in KEYS_TO_CHECK_STEADY}
-        self.init_steady_last_check = {key: None for key in KEYS_TO_CHECK_STEADY}
+        self.init_steady_history = SteadyHistory(len(KEYS_TO_CHECK_STEADY))
+        self.init_steady_stats = [RunningStats() for _ in KEYS_TO_CHECK_STEADY]
 
     def wheel_on(self, speed: float, gimbal: float = 45):
         print(
@@ -175,84 +469,89 @@ class Device:
         command = WHEEL_ON_COMMAND + [f"{speed},{gimbal}"]
         subprocess.run(command, check=True)
 
-    def under_threshold(self, row: dict) -> bool:
-        for key in KEYS_TO_CHECK_THRESHOLD:
-            if row.get(key, 0) >= self.threshold:
-                return False
-        return True
+    def threshold_readings(self, row: dict) -> tuple:
+        """Values of KEYS_TO_CHECK_THRESHOLD in one gather (missing keys count as 0)."""
+        try:
+            return self.threshold_getter(row)
+        except KeyError:
+            return tuple(row.get(key, 0) for key in KEYS_TO_CHECK_THRESHOLD)
+
+    def under_threshold(self, readings: tuple) -> bool:
+        return max(readings) < self.threshold
 
     def check_init_steady(self, row: dict) -> bool:
-        return self._check_steady(row, self.init_steady_history, self.init_steady_last_check)
+        return self._check_steady(row, self.init_steady_history, self.init_steady_stats)
     
     def check_steady(self, row: dict) -> bool:
-        return self._check_steady(row, self.steady_history, self.steady_last_check)
+        return self._check_steady(row, self.steady_history, self.steady_stats)
+
+    def _check_steady(self, row: dict[str, float], history: SteadyHistory, steady_stats: list[RunningStats]) -> bool:
+        # Callers only check when steady_window/threshold/check_every are all set
+        time = row["TIME"]
+        check_every = self.steady_check_every
+        window = self.steady_window
 
-    def _check_steady(self, row: dict[str, float], steady_history: dict[str, deque[SteadyEntry]], steady_last_check: dict[str, float]) -> bool:
+        temps = self.steady_values(row)
+        history.append(time, temps)
+        for stats, temp in zip(steady_stats, temps):
+            stats.add(temp)
+
+        first_time = history.first_time()
+        last_check = history.last_check
         if (
-            self.steady_window is None
-            or self.steady_threshold is None
-            or self.steady_check_every is None
+            (last_check is not None and time - last_check < check_every) or
+            time - first_time < check_every
         ):
             return False
-        
-        # Skip checking steady state during defer period
-        time = row["TIME"]
-        steady = {key: False for key in KEYS_TO_CHECK_STEADY}
-
-        has_checked = False
-        for key in KEYS_TO_CHECK_STEADY:
-            history = steady_history[key]
-            temp = row[key]
-            time = row["TIME"]
 
-            history.append(self.SteadyEntry(time, temp))  # (time, value)
-            
-            last_entry = history[-1]
-            first_entry = history[0]
-            if (
-                (steady_last_check[key] is not None and last_entry.time - steady_last_check[key] < self.steady_check_every) or
-                last_entry.time - first_entry.time < self.steady_check_every
-            ):
-                continue
+        history.last_check = time
+        if time - first_time < window:
+            return False
 
-            steady_last_check[key] = last_entry.time
-            if last_entry.time - first_entry.time < self.steady_window:
-                continue
+        # Clean up old entries
+        for stats, temps in zip(steady_stats, history.trim(time, window)):
+            for temp in temps:
+                stats.remove(temp)
+        
+        first_time = history.first_time()
+        
+        if self.steady_sigma:
+            # scipy is only needed for smoothing, so its import is deferred to here
+            from scipy.ndimage import gaussian_filter1d
+            # Smooth and reduce every key's window in one call each
+            filtered = gaussian_filter1d(history.window(), sigma=self.steady_sigma, axis=1)
+            stds = np.std(filtered, axis=1).tolist()
+        else:
+            # No smoothing: the running std over the window is enough
+            stds = [stats.std() for stats in steady_stats]
 
-            # Clean up old entries
-            while last_entry.time - history[0].time >= self.steady_window:
-                history.popleft()
-            
-            first_entry = history[0]
-            has_checked = True
-            
-            data = [e.value for e in history]
-            filtered = gaussian_filter1d(data, sigma=self.steady_sigma)
-            std = np.std(filtered)
-            print(f"Steady check for {key}: std = {std:.4f} °C over last {last_entry.time - first_entry.time:.2f} seconds", end="")
+        steady = True
+        for key, std in zip(KEYS_TO_CHECK_STEADY, stds):
+            print(f"Steady check for {key}: std = {std:.4f} °C over last {time - first_time:.2f} seconds", end="")
 
             if std < self.steady_threshold:
                 print(" -> STEADY")
-                steady[key] = True
             else:
                 print(" -> NOT STEADY")
-                steady[key] = False
-        
-        if has_checked:
-            print()
+                steady = False
+        print()
 
-        return all(steady.values())
+        return steady
 
     def terminate(self):
+        # The device must end up idle, so keep retrying, but back off between attempts
+        attempt = 0
         while not self.terminated:
+            if attempt:
+                time.sleep(min(2 ** (attempt - 1), TERMINATE_MAX_DELAY))
+            attempt += 1
             print("Terminating device...")
-            term_proc = subprocess.Popen(
-                TERMINATE_COMMAND,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-            _, _ = term_proc.communicate()
+            try:
+                term_proc = subprocess.run(
+                    TERMINATE_COMMAND, capture_output=True, timeout=TERMINATE_TIMEOUT
+                )
+            except subprocess.TimeoutExpired:
+                continue
             if term_proc.returncode == 0:
                 self.terminated = True
 
@@ -273,8 +572,11 @@ def run_experiment(
     steady_sigma: Optional[float] = None,
     steady_threshold: Optional[float] = None,
     steady_check_every: Optional[int] = None,
+    pretty: bool = False,
+    every: int = 1,
+    quiet: bool = False,
 ):
-    logger = Logger(name, output_append=append)
+    logger = Logger(name, output_append=append, pretty=pretty, log_every=every, quiet=quiet)
     logger.write_meta(
         {
             "speed": speed if speed is not None else "null",
@@ -299,7 +601,8 @@ def run_experiment(
         steady_check_every=steady_check_every,
     )
     
-    # Register termination at interrupt
+    # Register termination at interrupt; buffered rows are written on close
+    atexit.register(logger.close)
     atexit.register(device.terminate)
 
     print("Starting monitoring...")
@@ -321,28 +624,37 @@ def run_experiment(
         )
     print()
 
+    steady_enabled = (
+        steady_window is not None
+        and steady_threshold is not None
+        and steady_check_every is not None
+    )
+
     try:
-        start_time = time.time()
+        # Monotonic clock: NTP or manual clock changes can't shorten or extend the run
+        start_time = time.monotonic()
         motor_activated = False
 
         for i, row in reader.read():
+            # Gathered once, used for both the abnormal and the threshold check
+            readings = device.threshold_readings(row)
+
             # Check abnormal temperatures (negative values)
-            if any(row[key] < 0.0 for key in KEYS_TO_CHECK_THRESHOLD):
+            if min(readings) < 0.0:
                 continue
             
             if i == 0:
                 logger.log_columns(row)
             logger.log_row(row)
             
-            if not device.under_threshold(row):
+            if not device.under_threshold(readings):
                 print(
                     f"Threshold of {threshold} °C exceeded.\n"
                     + "Stopping the test."
                 )
                 break
                 
-            current_time = time.time()
-            elapsed_time = current_time - start_time
+            elapsed_time = time.monotonic() - start_time
             if elapsed_time >= time_limit:
                 print(
                     f"Time limit of {time_limit} seconds reached.\n"
@@ -354,7 +666,7 @@ def run_experiment(
                 continue
             
             if check_init_steady:
-                if device.check_init_steady(row):
+                if steady_enabled and device.check_init_steady(row):
                     print(
                         f"Initial steady state achieved within {steady_window} seconds "
                         + f"with variation less than {steady_threshold} °C.\n"
@@ -372,7 +684,7 @@ def run_experiment(
                     device.wheel_on(speed=speed, gimbal=gimbal)
                 motor_activated = True
 
-            if device.check_steady(row):
+            if steady_enabled and device.check_steady(row):
                 print(
                     f"Steady state achieved within {steady_window} seconds "
                     + f"with variation less than {steady_threshold} °C.\n"
@@ -385,9 +697,11 @@ def run_experiment(
         traceback.print_exc()
     
     device.terminate()
+    logger.close()
     
     # Remove termination at exit
     atexit.unregister(device.terminate)
+    atexit.unregister(logger.close)
 
 
 def main(
@@ -417,7 +731,7 @@ def main(
         None, help="Time window to check for steadiness in seconds"
     ),
     steady_sigma: Optional[float] = typer.Option(
-        None, help="Sigma for Gaussian smoothing when checking for steadiness"
+        None, help="Sigma for Gaussian smoothing when checking for steadiness (omit or 0 for no smoothing)"
     ),
     steady_threshold: Optional[float] = typer.Option(
         None, help="Maximum allowed variation in temperature for steadiness (°C)"
@@ -425,6 +739,15 @@ def main(
     steady_check_every: Optional[int] = typer.Option(
         None, help="Interval to check for steadiness in seconds"
     ),
+    pretty: bool = typer.Option(
+        False, help="Write log.txt as indented per-key blocks instead of one JSON object per line"
+    ),
+    every: int = typer.Option(
+        1, min=1, help="Write only every N-th row to log.txt (data.csv keeps all rows)"
+    ),
+    quiet: bool = typer.Option(
+        False, help="Do not write rows to log.txt (data.csv keeps all rows)"
+    ),
 ):
     if speeds is None:
         speeds = [None]
@@ -450,6 +773,9 @@ def main(
             steady_sigma=steady_sigma,
             steady_threshold=steady_threshold,
             steady_check_every=steady_check_every,
+            pretty=pretty,
+            every=every,
+            quiet=quiet,
         )
 
 
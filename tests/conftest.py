@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# monitor.py is a top-level script rather than an installed package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
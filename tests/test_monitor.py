@@ -0,0 +1,70 @@
+from monitor import Logger
+
+
+def read_csv(tmp_path, name):
+    return (tmp_path / "output" / name / "data.csv").read_text().splitlines()
+
+
+def test_log_row_missing_column(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = Logger("missing")
+    logger.log_row({"TIME": 0.0, "POWER_V": 12.0, "THERMO_A_TEMP": 25.5})
+    logger.log_row({"TIME": 1.0, "THERMO_A_TEMP": 26.0})
+    logger.close()
+
+    assert read_csv(tmp_path, "missing") == [
+        "TIME,POWER_V,THERMO_A_TEMP",
+        "0.0,12.0,25.5",
+        "1.0,,26.0",
+    ]
+
+
+def test_log_row_extra_column(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = Logger("extra", pretty=True)
+    logger.log_row({"TIME": 0.0, "POWER_V": 12.0})
+    logger.log_row({"TIME": 1.0, "THERMO_A_TEMP": 26.0})
+    logger.close()
+
+    assert read_csv(tmp_path, "extra") == [
+        "TIME,POWER_V",
+        "0.0,12.0",
+        "1.0,",
+    ]
+    assert "THERMO_A_TEMP: 26.0" in (tmp_path / "output" / "extra" / "log.txt").read_text()
+
+
+def test_log_row_single_column(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = Logger("single")
+    logger.log_row({"TIME": 0.0})
+    logger.log_row({"TIME": 1.5})
+    logger.close()
+
+    assert read_csv(tmp_path, "single") == ["TIME", "0.0", "1.5"]
+
+
+def test_log_row_pretty_without_time(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = Logger("no_time", pretty=True)
+    logger.log_row({"POWER_V": 12.0})
+    logger.close()
+
+    assert read_csv(tmp_path, "no_time") == ["POWER_V", "12.0"]
+    assert (tmp_path / "output" / "no_time" / "log.txt").read_text() == "Timestamp: None\n  POWER_V: 12.0\n\n"
+
+
+def test_log_row_string_after_numeric(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = Logger("quoted")
+    logger.log_row({"TIME": 0.0, "STATUS": 1})
+    logger.log_row({"TIME": 1.0, "STATUS": 'a,"b"'})
+    logger.log_row({"TIME": 2.0, "STATUS": None})
+    logger.close()
+
+    assert read_csv(tmp_path, "quoted") == [
+        "TIME,STATUS",
+        "0.0,1",
+        '1.0,"a,""b"""',
+        "2.0,",
+    ]
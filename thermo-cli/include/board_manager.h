@@ -23,6 +23,9 @@ int board_manager_init(BoardManager *mgr, ThermalSource *sources, int source_cou
 /* Apply calibration coefficients and TC type settings for all sources */
 int board_manager_configure(BoardManager *mgr);
 
+/* Apply only calibration coefficients (those differing from the defaults) */
+int board_manager_set_calibration(BoardManager *mgr);
+
 /* Apply only TC type settings (useful when calibration already set) */
 int board_manager_set_tc_types(BoardManager *mgr);
 
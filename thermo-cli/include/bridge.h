@@ -8,11 +8,15 @@
 
 #include "common.h"
 
+/* Default minimum seconds between thermal hardware reads */
+#define BRIDGE_DEFAULT_MIN_INTERVAL 0.05
+
 /* Opaque bridge structure */
 typedef struct FuseBridge FuseBridge;
 
 /* Bridge functions */
-FuseBridge* bridge_create(ThermalSource *sources, int source_count, char **args, int arg_count, const char *time_format);
+FuseBridge* bridge_create(ThermalSource *sources, int source_count, char **args, int arg_count,
+                          const char *time_format, double min_interval);
 int bridge_run(FuseBridge *bridge);
 void bridge_free(FuseBridge *bridge);
 
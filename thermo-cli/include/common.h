@@ -14,8 +14,6 @@
 #define DEFAULT_CALIBRATION_OFFSET -38.955465
 #define DEFAULT_UPDATE_INTERVAL 1  /* seconds */
 
-#define MCC134_NUM_CHANNELS 4
-
 /* ============================================================================
  * DATA STRUCTURES
  * These provide cleaner separation between static board info and dynamic readings.
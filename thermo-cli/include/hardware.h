@@ -17,6 +17,9 @@
 #define THERMO_NOT_FOUND -3
 #define THERMO_IO_ERROR -4
 
+/* Number of thermocouple channels per MCC 134 board */
+#define MCC134_NUM_CHANNELS 4
+
 /* Thermocouple type constants */
 #define TC_TYPE_J 0
 #define TC_TYPE_K 1
@@ -55,10 +58,36 @@ int thermo_set_update_interval(uint8_t address, uint8_t interval);
 int thermo_set_tc_type(uint8_t address, uint8_t channel, const char *tc_type_str);
 uint8_t thermo_tc_type_from_string(const char *tc_type_str);
 
-/* Reading functions (board must be open, tc_type must be set for temp/adc) */
-int thermo_read_temp(uint8_t address, uint8_t channel, double *value);
-int thermo_read_adc(uint8_t address, uint8_t channel, double *value);
-int thermo_read_cjc(uint8_t address, uint8_t channel, double *value);
+/*
+ * Reading functions (board must be open, tc_type must be set for temp/adc).
+ * These sit on the sampling hot path, so they are inlined into the callers.
+ */
+
+/* Read temperature from channel */
+static inline int thermo_read_temp(uint8_t address, uint8_t channel, double *value) {
+    if (value == NULL || channel >= MCC134_NUM_CHANNELS) {
+        return THERMO_INVALID_PARAM;
+    }
+    return (mcc134_t_in_read(address, channel, value) == RESULT_SUCCESS) ? THERMO_SUCCESS : THERMO_ERROR;
+}
+
+/* Read ADC voltage from channel */
+static inline int thermo_read_adc(uint8_t address, uint8_t channel, double *value) {
+    if (value == NULL || channel >= MCC134_NUM_CHANNELS) {
+        return THERMO_INVALID_PARAM;
+    }
+    return (mcc134_a_in_read(address, channel, OPTS_DEFAULT, value) == RESULT_SUCCESS) ? THERMO_SUCCESS : THERMO_ERROR;
+}
+
+/* Read CJC temperature from channel */
+static inline int thermo_read_cjc(uint8_t address, uint8_t channel, double *value) {
+    if (value == NULL || channel >= MCC134_NUM_CHANNELS) {
+        return THERMO_INVALID_PARAM;
+    }
+    return (mcc134_cjc_read(address, channel, value) == RESULT_SUCCESS) ? THERMO_SUCCESS : THERMO_ERROR;
+}
+
+uint8_t thermo_read_temp_all(uint8_t address, uint8_t channel_mask, double *values);
 void thermo_wait_for_readings(void);
 
 #endif /* HARDWARE_H */
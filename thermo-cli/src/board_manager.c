@@ -46,6 +46,14 @@ int board_manager_init(BoardManager *mgr, ThermalSource *sources, int source_cou
 
 /* Apply calibration coefficients and TC type settings for all sources */
 int board_manager_configure(BoardManager *mgr) {
+    board_manager_set_calibration(mgr);
+    board_manager_set_tc_types(mgr);
+    
+    return THERMO_SUCCESS;
+}
+
+/* Apply only non-default calibration coefficients */
+int board_manager_set_calibration(BoardManager *mgr) {
     for (int i = 0; i < mgr->source_count; i++) {
         ThermalSource *src = &mgr->sources[i];
         
@@ -62,12 +70,6 @@ int board_manager_configure(BoardManager *mgr) {
                         src->address, src->channel);
             }
         }
-        
-        /* Set TC type */
-        if (thermo_set_tc_type(src->address, src->channel, src->tc_type) != THERMO_SUCCESS) {
-            fprintf(stderr, "Warning: Failed to set TC type for address %d, channel %d\n",
-                    src->address, src->channel);
-        }
     }
     
     return THERMO_SUCCESS;
@@ -6,7 +6,9 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <errno.h>
 #include <unistd.h>
+#include <poll.h>
 #include <sys/wait.h>
 #include <sys/time.h>
 #include <time.h>
@@ -21,23 +23,127 @@
 
 #include "cJSON.h"
 
+/* Size of the buffer used to read cmg-cli output from the pipe */
+#define BRIDGE_READ_BUFFER_SIZE 65536
+
+/* Size of the stdout buffer, so each batch is written with one syscall */
+#define BRIDGE_WRITE_BUFFER_SIZE 65536
+
+/*
+ * A source is only re-read once this fraction of its board's update interval
+ * has passed; the MCC 134 does not produce new values any faster than that.
+ */
+#define BRIDGE_READ_TTL_FACTOR 0.5
+
+/* Initial size of the reusable JSON print buffers (grown on demand) */
+#define BRIDGE_JSON_BUFFER_SIZE 1024
+
+/* Marker strftime copies through in place of each %f (one byte per digit) */
+#define USEC_PLACEHOLDER '\x01'
+#define USEC_DIGITS 6
+#define MAX_USEC_FIELDS 8
+
+/* Deepest nesting the raw fast path checks; deeper lines are fully parsed */
+#define RAW_MAX_DEPTH 32
+
+/* Reusable output buffer for cJSON_PrintPreallocated */
+typedef struct {
+    char *data;
+    int size;
+} JsonBuffer;
+
 struct FuseBridge {
     ThermalSource *sources;
     int source_count;
+    ChannelReading *readings;     /* Per-source reading buffer, reused across reads */
+    struct timespec *read_ts;     /* Monotonic time of each source's last hardware read */
+    double *read_ttl;             /* Seconds a source's reading stays valid */
     char **args;
     int arg_count;
     BoardManager board_mgr;
     int boards_initialized;
-    char time_format[64];
+    char time_format[128];        /* Timestamp format with %f turned into placeholders */
+    time_t ts_sec;                /* Second that ts_text was formatted for */
+    char ts_text[64];             /* strftime output for ts_sec (placeholders included) */
+    int usec_pos[MAX_USEC_FIELDS]; /* Offsets of the microsecond fields in ts_text */
+    int usec_count;
+    struct timeval batch_tv;      /* Arrival time of the current read batch */
+    char batch_ts[64];            /* batch_tv formatted, valid if batch_ts_ready */
+    int batch_ts_ready;
+    int batch_thermal_ready;      /* Thermal cache already checked for this batch */
+    double min_interval;          /* Minimum seconds between hardware reads */
+    cJSON *thermal_cache;         /* Last thermal readings, reused within min_interval */
+    JsonBuffer thermal_buf;       /* Holds thermal_cache printed as compact JSON */
+    const char *thermal_json;     /* thermal_buf contents, NULL if printing failed */
+    JsonBuffer line_buf;          /* Output buffer for lines that need a full parse */
+    int raw_enabled;              /* A line has parsed as an object; fast path allowed */
+    struct timespec thermal_ts;   /* Monotonic time of the last hardware read */
 };
 
+/*
+ * Replace each %f in a timestamp format with placeholder bytes that strftime
+ * leaves untouched, so the format is only scanned once. %% is kept as is.
+ */
+static void compile_time_format(char *dst, size_t dst_size, const char *format) {
+    size_t n = 0;
+    const char *src = format;
+    
+    while (*src && n + USEC_DIGITS < dst_size) {
+        if (src[0] == '%' && src[1] == 'f') {
+            memset(dst + n, USEC_PLACEHOLDER, USEC_DIGITS);
+            n += USEC_DIGITS;
+            src += 2;
+        } else if (src[0] == '%' && src[1] == '%') {
+            dst[n++] = *src++;
+            dst[n++] = *src++;
+        } else {
+            dst[n++] = *src++;
+        }
+    }
+    dst[n] = '\0';
+}
+
 /* Create a new bridge instance */
-FuseBridge* bridge_create(ThermalSource *sources, int source_count, char **args, int arg_count, const char *time_format) {
+FuseBridge* bridge_create(ThermalSource *sources, int source_count, char **args, int arg_count,
+                          const char *time_format, double min_interval) {
+    if (source_count <= 0) {
+        fprintf(stderr, "Error: No valid thermal sources\n");
+        return NULL;
+    }
+    
+    /* Addresses and channels index the per-board masks and reading arrays */
+    for (int i = 0; i < source_count; i++) {
+        if (sources[i].address >= MAX_BOARDS || sources[i].channel >= MCC134_NUM_CHANNELS) {
+            fprintf(stderr, "Error: Invalid source %d (address %d, channel %d); "
+                            "address must be 0-%d and channel 0-%d\n",
+                    i, sources[i].address, sources[i].channel,
+                    MAX_BOARDS - 1, MCC134_NUM_CHANNELS - 1);
+            return NULL;
+        }
+    }
+    
     FuseBridge *bridge = (FuseBridge*)malloc(sizeof(FuseBridge));
     
     bridge->sources = (ThermalSource*)malloc(source_count * sizeof(ThermalSource));
     memcpy(bridge->sources, sources, source_count * sizeof(ThermalSource));
     bridge->source_count = source_count;
+    bridge->readings = (ChannelReading*)calloc(source_count, sizeof(ChannelReading));
+    bridge->read_ts = (struct timespec*)calloc(source_count, sizeof(struct timespec));
+    bridge->read_ttl = (double*)malloc(source_count * sizeof(double));
+    
+    /* A board runs at the update interval of the first source that opens it */
+    for (int i = 0; i < source_count; i++) {
+        int first = i;
+        for (int j = 0; j < i; j++) {
+            if (sources[j].address == sources[i].address) {
+                first = j;
+                break;
+            }
+        }
+        int interval = sources[first].update_interval > 0 ?
+                       sources[first].update_interval : DEFAULT_UPDATE_INTERVAL;
+        bridge->read_ttl[i] = interval * BRIDGE_READ_TTL_FACTOR;
+    }
     
     bridge->args = (char**)malloc(arg_count * sizeof(char*));
     for (int i = 0; i < arg_count; i++) {
@@ -45,8 +151,15 @@ FuseBridge* bridge_create(ThermalSource *sources, int source_count, char **args,
     }
     bridge->arg_count = arg_count;
     bridge->boards_initialized = 0;
-    strncpy(bridge->time_format, time_format, sizeof(bridge->time_format) - 1);
-    bridge->time_format[sizeof(bridge->time_format) - 1] = '\0';
+    compile_time_format(bridge->time_format, sizeof(bridge->time_format), time_format);
+    bridge->ts_sec = (time_t)-1;
+    bridge->usec_count = 0;
+    bridge->min_interval = min_interval;
+    bridge->thermal_cache = NULL;
+    bridge->thermal_json = NULL;
+    bridge->thermal_buf = (JsonBuffer){0};
+    bridge->line_buf = (JsonBuffer){0};
+    bridge->raw_enabled = 0;
     
     return bridge;
 }
@@ -61,6 +174,12 @@ void bridge_free(FuseBridge *bridge) {
     }
     
     if (bridge->sources) free(bridge->sources);
+    free(bridge->readings);
+    free(bridge->read_ts);
+    free(bridge->read_ttl);
+    cJSON_Delete(bridge->thermal_cache);
+    free(bridge->thermal_buf.data);
+    free(bridge->line_buf.data);
     
     for (int i = 0; i < bridge->arg_count; i++) {
         free(bridge->args[i]);
@@ -86,82 +205,200 @@ static int bridge_init_boards(FuseBridge *bridge) {
     return 0;
 }
 
-/* Get thermal data from all configured sources (boards must be initialized) */
-static cJSON* get_thermal_data(FuseBridge *bridge) {
-    cJSON *data = cJSON_CreateObject();
+/* Seconds elapsed between two monotonic timestamps */
+static double timespec_elapsed(const struct timespec *start, const struct timespec *end) {
+    return (end->tv_sec - start->tv_sec) + (end->tv_nsec - start->tv_nsec) / 1e9;
+}
+
+/*
+ * Read all sources whose last reading is older than their TTL (boards must
+ * be initialized). Due channels are read per board: the temperatures of a
+ * board in one batch, then ADC and CJC per channel, all before any JSON is
+ * built. A channel shared by several sources is read once.
+ * Returns the number of sources that were read.
+ */
+static int collect_thermal_readings(FuseBridge *bridge, const struct timespec *now, int force) {
+    uint8_t board_mask[MAX_BOARDS] = {0};
+    int count = 0;
     
     for (int i = 0; i < bridge->source_count; i++) {
-        ThermalSource *src = &bridge->sources[i];
-        double temp, adc, cjc;
-        
-        /* Create a sub-object for each source */
-        cJSON *source_data = cJSON_CreateObject();
-        
-        /* Read temperature (board is already open with TC type set) */
-        int temp_result = mcc134_t_in_read(src->address, src->channel, &temp);
-        if (temp_result == RESULT_SUCCESS) {
-            cJSON_AddNumberToObject(source_data, "TEMP", temp);
-        } else {
-            cJSON_AddNumberToObject(source_data, "TEMP", 0.0/0.0);
+        if (force || timespec_elapsed(&bridge->read_ts[i], now) >= bridge->read_ttl[i]) {
+            board_mask[bridge->sources[i].address] |= (1 << bridge->sources[i].channel);
         }
+    }
+    
+    for (int addr = 0; addr < MAX_BOARDS; addr++) {
+        if (!board_mask[addr]) continue;
         
-        /* Read ADC voltage */
-        int adc_result = mcc134_a_in_read(src->address, src->channel, OPTS_DEFAULT, &adc);
-        if (adc_result == RESULT_SUCCESS) {
-            cJSON_AddNumberToObject(source_data, "ADC", adc);
-        } else {
-            cJSON_AddNumberToObject(source_data, "ADC", 0.0/0.0);
+        double temps[MCC134_NUM_CHANNELS];
+        double adcs[MCC134_NUM_CHANNELS];
+        double cjcs[MCC134_NUM_CHANNELS];
+        uint8_t temp_ok = thermo_read_temp_all(addr, board_mask[addr], temps);
+        uint8_t adc_ok = 0, cjc_ok = 0;
+        for (uint8_t ch = 0; ch < MCC134_NUM_CHANNELS; ch++) {
+            if (!(board_mask[addr] & (1 << ch))) continue;
+            if (thermo_read_adc(addr, ch, &adcs[ch]) == THERMO_SUCCESS) adc_ok |= (1 << ch);
+            if (thermo_read_cjc(addr, ch, &cjcs[ch]) == THERMO_SUCCESS) cjc_ok |= (1 << ch);
         }
         
-        /* Read CJC temperature */
-        int cjc_result = mcc134_cjc_read(src->address, src->channel, &cjc);
-        if (cjc_result == RESULT_SUCCESS) {
-            cJSON_AddNumberToObject(source_data, "CJC", cjc);
-        } else {
-            cJSON_AddNumberToObject(source_data, "CJC", 0.0/0.0);
+        /* Hand the board's values to every due source on it */
+        for (int i = 0; i < bridge->source_count; i++) {
+            uint8_t ch = bridge->sources[i].channel;
+            if (bridge->sources[i].address != addr || !(board_mask[addr] & (1 << ch))) continue;
+            if (!force && timespec_elapsed(&bridge->read_ts[i], now) < bridge->read_ttl[i]) continue;
+            
+            ChannelReading *reading = &bridge->readings[i];
+            channel_reading_init(reading, addr, ch);
+            reading->temperature = temps[ch];
+            reading->has_temp = (temp_ok >> ch) & 1;
+            reading->adc_voltage = adcs[ch];
+            reading->has_adc = (adc_ok >> ch) & 1;
+            reading->cjc_temp = cjcs[ch];
+            reading->has_cjc = (cjc_ok >> ch) & 1;
+            bridge->read_ts[i] = *now;
+            count++;
         }
+    }
+    return count;
+}
+
+/* Build the thermal data object from the current readings */
+static cJSON* get_thermal_data(FuseBridge *bridge) {
+    cJSON *data = cJSON_CreateObject();
+    
+    for (int i = 0; i < bridge->source_count; i++) {
+        const ChannelReading *reading = &bridge->readings[i];
+        
+        /* Create a sub-object for each source (NaN for failed reads) */
+        cJSON *source_data = cJSON_CreateObject();
+        cJSON_AddNumberToObject(source_data, "TEMP", reading->has_temp ? reading->temperature : 0.0/0.0);
+        cJSON_AddNumberToObject(source_data, "ADC", reading->has_adc ? reading->adc_voltage : 0.0/0.0);
+        cJSON_AddNumberToObject(source_data, "CJC", reading->has_cjc ? reading->cjc_temp : 0.0/0.0);
         
         /* Add the source data object to the main data object */
-        cJSON_AddItemToObject(data, src->key, source_data);
+        cJSON_AddItemToObject(data, bridge->sources[i].key, source_data);
     }
     
     return data;
 }
 
 /*
- * Format timestamp with microsecond support.
- * Use %f in format string for 6-digit microseconds.
+ * Print a cJSON item compactly into a reusable buffer, growing it until the
+ * output fits. Returns the buffer contents, or NULL on allocation failure.
  */
-static void format_timestamp(char *buf, size_t buf_size, const struct timeval *tv, const char *format) {
-    struct tm *tm_info = localtime(&tv->tv_sec);
+static const char* json_print_buffered(cJSON *item, JsonBuffer *buf) {
+    if (!buf->data) {
+        buf->data = (char*)malloc(BRIDGE_JSON_BUFFER_SIZE);
+        if (!buf->data) return NULL;
+        buf->size = BRIDGE_JSON_BUFFER_SIZE;
+    }
     
-    /* First pass: replace %f with microseconds placeholder */
-    char temp_format[128];
-    char *dst = temp_format;
-    const char *src = format;
-    char usec_str[8];
-    snprintf(usec_str, sizeof(usec_str), "%06ld", (long)tv->tv_usec);
-    
-    while (*src && (dst - temp_format) < (int)sizeof(temp_format) - 7) {
-        if (*src == '%' && *(src + 1) == 'f') {
-            /* Replace %f with microseconds */
-            strcpy(dst, usec_str);
-            dst += 6;
-            src += 2;
-        } else {
-            *dst++ = *src++;
+    while (!cJSON_PrintPreallocated(item, buf->data, buf->size, 0)) {
+        char *grown = (char*)realloc(buf->data, buf->size * 2);
+        if (!grown) return NULL;
+        buf->data = grown;
+        buf->size *= 2;
+    }
+    return buf->data;
+}
+
+/*
+ * Get thermal data, reusing the cached readings when the last hardware read
+ * is more recent than min_interval. The returned object is owned by the bridge.
+ * Sources are only re-read once their own TTL has passed, and the object and
+ * its compact JSON text are only rebuilt when some reading changed.
+ */
+static cJSON* bridge_get_thermal_data(FuseBridge *bridge) {
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    
+    if (bridge->thermal_cache &&
+        timespec_elapsed(&bridge->thermal_ts, &now) < bridge->min_interval) {
+        return bridge->thermal_cache;
+    }
+    
+    int first = (bridge->thermal_cache == NULL);
+    bridge->thermal_ts = now;
+    if (collect_thermal_readings(bridge, &now, first) == 0) {
+        return bridge->thermal_cache;
+    }
+    
+    cJSON_Delete(bridge->thermal_cache);
+    bridge->thermal_cache = get_thermal_data(bridge);
+    bridge->thermal_json = json_print_buffered(bridge->thermal_cache, &bridge->thermal_buf);
+    
+    return bridge->thermal_cache;
+}
+
+/*
+ * Format timestamp with microsecond support (%f in the format gives 6-digit
+ * microseconds). strftime only runs when the second changes; otherwise the
+ * cached text is copied and just the microsecond digits are filled in.
+ */
+static void format_timestamp(FuseBridge *bridge, char *buf, size_t buf_size, const struct timeval *tv) {
+    if (tv->tv_sec != bridge->ts_sec) {
+        struct tm *tm_info = localtime(&tv->tv_sec);
+        if (strftime(bridge->ts_text, sizeof(bridge->ts_text), bridge->time_format, tm_info) == 0) {
+            bridge->ts_text[0] = '\0';
+        }
+        bridge->ts_sec = tv->tv_sec;
+        
+        /* Record where the microsecond placeholders ended up */
+        bridge->usec_count = 0;
+        for (char *p = bridge->ts_text; (p = strchr(p, USEC_PLACEHOLDER)) != NULL; p += USEC_DIGITS) {
+            if (bridge->usec_count == MAX_USEC_FIELDS) break;
+            bridge->usec_pos[bridge->usec_count++] = p - bridge->ts_text;
         }
     }
-    *dst = '\0';
     
-    strftime(buf, buf_size, temp_format, tm_info);
+    strncpy(buf, bridge->ts_text, buf_size - 1);
+    buf[buf_size - 1] = '\0';
+    
+    char digits[USEC_DIGITS];
+    long usec = (long)tv->tv_usec;
+    for (int i = USEC_DIGITS - 1; i >= 0; i--) {
+        digits[i] = '0' + usec % 10;
+        usec /= 10;
+    }
+    for (int i = 0; i < bridge->usec_count; i++) {
+        if (bridge->usec_pos[i] + USEC_DIGITS < (int)buf_size) {
+            memcpy(buf + bridge->usec_pos[i], digits, USEC_DIGITS);
+        }
+    }
+}
+
+/*
+ * Start a new read batch. Lines that arrived in the same read share one
+ * timestamp and one thermal cache check, both done lazily on the first
+ * JSON line of the batch.
+ */
+static void bridge_begin_batch(FuseBridge *bridge) {
+    gettimeofday(&bridge->batch_tv, NULL);
+    bridge->batch_ts_ready = 0;
+    bridge->batch_thermal_ready = 0;
+}
+
+/* Timestamp of the current batch */
+static const char* batch_timestamp(FuseBridge *bridge) {
+    if (!bridge->batch_ts_ready) {
+        format_timestamp(bridge, bridge->batch_ts, sizeof(bridge->batch_ts), &bridge->batch_tv);
+        bridge->batch_ts_ready = 1;
+    }
+    return bridge->batch_ts;
+}
+
+/* Thermal data for the current batch (refreshed at most once per batch) */
+static cJSON* batch_thermal_data(FuseBridge *bridge) {
+    if (!bridge->batch_thermal_ready) {
+        bridge_get_thermal_data(bridge);
+        bridge->batch_thermal_ready = 1;
+    }
+    return bridge->thermal_cache;
 }
 
 /* Inject thermal data into JSON object */
-static void inject_json(cJSON *json_obj, cJSON *thermal_data, const struct timeval *tv, const char *time_format) {
+static void inject_json(cJSON *json_obj, cJSON *thermal_data, const char *timestamp) {
     /* Add timestamp */
-    char timestamp[64];
-    format_timestamp(timestamp, sizeof(timestamp), tv, time_format);
     cJSON_AddStringToObject(json_obj, "TIMESTAMP", timestamp);
     
     cJSON *sub_obj = cJSON_CreateObject();
@@ -175,8 +412,182 @@ static void inject_json(cJSON *json_obj, cJSON *thermal_data, const struct timev
     }
 }
 
+/* Whitespace that may surround a JSON line */
+static int is_json_space(char c) {
+    return c == ' ' || c == '\t' || c == '\r';
+}
+
+/* Cheap pre-check so plain-text lines skip the JSON parser entirely */
+static int looks_like_json_object(const char *line) {
+    while (is_json_space(*line)) {
+        line++;
+    }
+    return *line == '{';
+}
+
+/* Write a string as JSON string contents (without the quotes) */
+static void write_json_escaped(const char *str) {
+    for (const char *p = str; *p; p++) {
+        unsigned char c = (unsigned char)*p;
+        if (c == '"' || c == '\\') {
+            putchar('\\');
+            putchar(c);
+        } else if (c < 0x20) {
+            printf("\\u%04x", c);
+        } else {
+            putchar(c);
+        }
+    }
+}
+
+/*
+ * Structural check for the fast path: [begin, end) must be one object whose
+ * strings, braces and brackets are balanced and whose members all start with
+ * a quoted key. Values themselves are not validated.
+ */
+static int scan_json_object(const char *begin, const char *end) {
+    char stack[RAW_MAX_DEPTH];    /* Opening bracket of each open container */
+    int depth = 0;
+    int expect_key = 0;           /* 1 after '{' (key or '}'), 2 after ',' (key only) */
+    
+    for (const char *p = begin; p < end; p++) {
+        char c = *p;
+        if (is_json_space(c)) continue;
+        
+        if (expect_key && c != '"' && !(c == '}' && expect_key == 1)) {
+            return 0;
+        }
+        expect_key = 0;
+        
+        switch (c) {
+            case '"':
+                for (p++; p < end && *p != '"'; p++) {
+                    if (*p == '\\' && ++p == end) return 0;
+                }
+                if (p == end) return 0;
+                break;
+            case '{':
+            case '[':
+                if (depth == RAW_MAX_DEPTH) return 0;
+                stack[depth++] = c;
+                if (c == '{') expect_key = 1;
+                break;
+            case '}':
+            case ']':
+                if (depth == 0 || stack[depth - 1] != (c == '}' ? '{' : '[')) return 0;
+                /* The outer object must close exactly at the end of the line */
+                if (--depth == 0 && p != end - 1) return 0;
+                break;
+            case ',':
+                if (stack[depth - 1] == '{') expect_key = 2;
+                break;
+        }
+    }
+    return depth == 0;
+}
+
+/*
+ * Fast path for a line holding a single JSON object: emit the line up to its
+ * closing brace and append TIMESTAMP and THERMOCOUPLE as raw text, without
+ * parsing and re-serializing the cmg-cli data.
+ * Returns 0 (and writes nothing) if the line does not pass scan_json_object.
+ */
+static int inject_raw(FuseBridge *bridge, const char *line, size_t len) {
+    const char *begin = line;
+    const char *end = line + len;
+    while (begin < end && is_json_space(*begin)) begin++;
+    while (end > begin && is_json_space(end[-1])) end--;
+    if (end - begin < 2 || *begin != '{' || end[-1] != '}' ||
+        !scan_json_object(begin, end)) {
+        return 0;
+    }
+    
+    /* Position of the closing brace; no separator needed for an empty object */
+    const char *close = end - 1;
+    const char *p = begin + 1;
+    while (p < close && is_json_space(*p)) p++;
+    int empty = (p == close);
+    
+    batch_thermal_data(bridge);
+    if (!bridge->thermal_json) {
+        return 0;
+    }
+    
+    fwrite(begin, 1, close - begin, stdout);
+    fputs(empty ? "\"TIMESTAMP\":\"" : ",\"TIMESTAMP\":\"", stdout);
+    write_json_escaped(batch_timestamp(bridge));
+    fputs("\",\"THERMOCOUPLE\":", stdout);
+    fputs(bridge->thermal_json, stdout);
+    fputs("}\n", stdout);
+    return 1;
+}
+
+/* Append one output line to the stdout buffer */
+static void bridge_write_line(const char *line, size_t len) {
+    fwrite(line, 1, len, stdout);
+    putchar('\n');
+}
+
+/* Check whether more cmg-cli output is already waiting in the pipe */
+static int pipe_has_data(int fd) {
+    struct pollfd pfd = { .fd = fd, .events = POLLIN };
+    return poll(&pfd, 1, 0) > 0 && (pfd.revents & POLLIN);
+}
+
+/* Handle one line of cmg-cli output (without its trailing newline) */
+static void bridge_process_line(FuseBridge *bridge, char *line, size_t len) {
+    /* Pass empty lines through */
+    if (len == 0) {
+        putchar('\n');
+        return;
+    }
+    
+    if (!looks_like_json_object(line)) {
+        /* Not JSON - pass through unchanged */
+        bridge_write_line(line, len);
+        return;
+    }
+    
+    /*
+     * Append the thermal data as text when the line is a complete object.
+     * Only enabled once a line has fully parsed as an object, so output that
+     * merely looks like {...} is never spliced into.
+     */
+    if (bridge->raw_enabled && inject_raw(bridge, line, len)) {
+        return;
+    }
+    
+    /* Otherwise fall back to a full parse */
+    cJSON *json_obj = cJSON_Parse(line);
+    if (json_obj) {
+        if (cJSON_IsObject(json_obj)) {
+            bridge->raw_enabled = 1;
+        }
+        
+        /* Get (possibly cached) thermal data and inject */
+        cJSON *thermal_data = batch_thermal_data(bridge);
+        inject_json(json_obj, thermal_data, batch_timestamp(bridge));
+        
+        const char *output = json_print_buffered(json_obj, &bridge->line_buf);
+        if (output) {
+            bridge_write_line(output, strlen(output));
+        }
+        
+        cJSON_Delete(json_obj);
+    } else {
+        /* Not JSON - pass through unchanged */
+        bridge_write_line(line, len);
+    }
+}
+
 /* Run the bridge - spawn cmg-cli and inject thermal data */
 int bridge_run(FuseBridge *bridge) {
+    /*
+     * Fully buffer stdout (it would be line buffered on a terminal), so the
+     * output of a whole batch goes out in a single write.
+     */
+    setvbuf(stdout, NULL, _IOFBF, BRIDGE_WRITE_BUFFER_SIZE);
+    
     /* Initialize boards first (before forking) */
     if (bridge_init_boards(bridge) != 0) {
         fprintf(stderr, "Error: Failed to initialize thermal boards\n");
@@ -221,57 +632,96 @@ int bridge_run(FuseBridge *bridge) {
         /* Parent process - read JSON lines and inject thermal data */
         close(pipefd[1]); /* Close write end */
         
-        FILE *fp = fdopen(pipefd[0], "r");
-        if (!fp) {
-            perror("fdopen");
+        int fd = pipefd[0];
+        char *buf = (char*)malloc(BRIDGE_READ_BUFFER_SIZE);
+        if (!buf) {
+            fprintf(stderr, "Error: Failed to allocate read buffer\n");
+            close(fd);
             return 1;
         }
+        size_t used = 0;
         
         /* Install signal handlers for graceful shutdown */
         signals_install_handlers();
         
-        char line[4096];
+        /*
+         * Wait for output at most min_interval at a time, so the thermal
+         * cache keeps being refreshed while cmg-cli is quiet. Without a
+         * minimum interval, just block until output arrives.
+         */
+        int poll_timeout_ms = -1;
+        if (bridge->min_interval > 0) {
+            poll_timeout_ms = (int)(bridge->min_interval * 1000);
+            if (poll_timeout_ms < 1) poll_timeout_ms = 1;
+        }
         
-        while (g_running && fgets(line, sizeof(line), fp)) {
-            /* Remove trailing newline */
-            size_t len = strlen(line);
-            if (len > 0 && line[len - 1] == '\n') {
-                line[len - 1] = '\0';
+        /*
+         * Read raw chunks from the pipe and split complete lines in place.
+         * A trailing partial line is kept for the next read. stdout is only
+         * flushed once the pipe is drained, so a burst of output from
+         * cmg-cli is written out as one batch.
+         */
+        while (g_running) {
+            struct pollfd pfd = { .fd = fd, .events = POLLIN };
+            int ready = poll(&pfd, 1, poll_timeout_ms);
+            if (ready < 0) {
+                if (errno == EINTR) continue;
+                perror("poll");
+                break;
             }
-            
-            /* Skip empty lines */
-            if (strlen(line) == 0) {
-                printf("\n");
-                fflush(stdout);
+            if (ready == 0) {
+                bridge_get_thermal_data(bridge);
                 continue;
             }
             
+            ssize_t n = read(fd, buf + used, BRIDGE_READ_BUFFER_SIZE - 1 - used);
+            if (n < 0) {
+                if (errno == EINTR) continue;
+                perror("read");
+                break;
+            }
+            if (n == 0) {
+                break;  /* EOF - cmg-cli exited */
+            }
+            used += n;
+            
             /* Capture timestamp when data arrives */
-            struct timeval tv;
-            gettimeofday(&tv, NULL);
+            bridge_begin_batch(bridge);
             
-            /* Try to parse as JSON */
-            cJSON *json_obj = cJSON_Parse(line);
-            if (json_obj) {
-                /* Get thermal data and inject */
-                cJSON *thermal_data = get_thermal_data(bridge);
-                inject_json(json_obj, thermal_data, &tv, bridge->time_format);
-                
-                char *output = cJSON_PrintUnformatted(json_obj);
-                printf("%s\n", output);
-                fflush(stdout);
-                
-                free(output);
-                cJSON_Delete(json_obj);
-                cJSON_Delete(thermal_data);
-            } else {
-                /* Not JSON - pass through unchanged */
-                printf("%s\n", line);
+            char *start = buf;
+            char *end = buf + used;
+            char *newline;
+            while ((newline = memchr(start, '\n', end - start)) != NULL) {
+                *newline = '\0';
+                bridge_process_line(bridge, start, newline - start);
+                start = newline + 1;
+            }
+            used = end - start;
+            
+            if (used == BRIDGE_READ_BUFFER_SIZE - 1) {
+                /* Line does not fit in the buffer - emit what we have */
+                buf[used] = '\0';
+                bridge_process_line(bridge, buf, used);
+                used = 0;
+            } else if (used > 0 && start != buf) {
+                memmove(buf, start, used);
+            }
+            
+            if (!pipe_has_data(fd)) {
                 fflush(stdout);
             }
         }
         
-        fclose(fp);
+        /* Emit a final line that was not newline-terminated */
+        if (g_running && used > 0) {
+            bridge_begin_batch(bridge);
+            buf[used] = '\0';
+            bridge_process_line(bridge, buf, used);
+            fflush(stdout);
+        }
+        
+        free(buf);
+        close(fd);
         
         /* Wait for child process */
         int status;
@@ -295,6 +745,7 @@ int cmd_fuse(int argc, char **argv) {
     char key[64] = "TEMP_FUSED";
     char tc_type[8] = "K";
     char time_format[64] = "%Y-%m-%dT%H:%M:%S.%f";  /* Default with microseconds */
+    double min_interval = BRIDGE_DEFAULT_MIN_INTERVAL;
     
     /* Find '--' separator */
     int separator_idx = -1;
@@ -316,6 +767,8 @@ int cmd_fuse(int argc, char **argv) {
         fprintf(stderr, "  -t, --tc-type TYPE     Thermocouple type (default: K)\n");
         fprintf(stderr, "  -T, --time-format FMT  Timestamp format (default: %%Y-%%m-%%dT%%H:%%M:%%S.%%f)\n");
         fprintf(stderr, "                         Use %%f for 6-digit microseconds\n");
+        fprintf(stderr, "  -I, --min-interval SEC Minimum seconds between thermal reads (default: %.2f)\n",
+                BRIDGE_DEFAULT_MIN_INTERVAL);
         fprintf(stderr, "\nNote: Data fusion only works with JSON output from cmg-cli.\n");
         fprintf(stderr, "      The --json flag will be added automatically if not specified.\n");
         fprintf(stderr, "\nExamples:\n");
@@ -334,12 +787,13 @@ int cmd_fuse(int argc, char **argv) {
         {"key", required_argument, 0, 'k'},
         {"tc-type", required_argument, 0, 't'},
         {"time-format", required_argument, 0, 'T'},
+        {"min-interval", required_argument, 0, 'I'},
         {0, 0, 0, 0}
     };
     
     int opt;
     while (optind < separator_idx && 
-           (opt = getopt_long(separator_idx, argv, "C:a:c:k:t:T:", long_options, NULL)) != -1) {
+           (opt = getopt_long(separator_idx, argv, "C:a:c:k:t:T:I:", long_options, NULL)) != -1) {
         switch (opt) {
             case 'C': config_path = optarg; break;
             case 'a': address = atoi(optarg); break;
@@ -347,12 +801,18 @@ int cmd_fuse(int argc, char **argv) {
             case 'k': strncpy(key, optarg, sizeof(key) - 1); break;
             case 't': strncpy(tc_type, optarg, sizeof(tc_type) - 1); break;
             case 'T': strncpy(time_format, optarg, sizeof(time_format) - 1); break;
+            case 'I': min_interval = atof(optarg); break;
             default:
                 fprintf(stderr, "Usage: thermo-cli fuse [OPTIONS] -- [cmg-cli arguments...]\n");
                 return 1;
         }
     }
     
+    if (min_interval < 0) {
+        fprintf(stderr, "Error: --min-interval must not be negative\n");
+        return 1;
+    }
+    
     /* Prepare sources */
     Config config = {0};
     ThermalSource single_source = {0};
@@ -368,6 +828,12 @@ int cmd_fuse(int argc, char **argv) {
         sources = config.sources;
         source_count = config.source_count;
     } else if (address >= 0 && channel >= 0) {
+        /* Checked here as int, before narrowing to the uint8_t source fields */
+        if (address >= MAX_BOARDS || channel >= MCC134_NUM_CHANNELS) {
+            fprintf(stderr, "Error: Address must be 0-%d and channel 0-%d\n",
+                    MAX_BOARDS - 1, MCC134_NUM_CHANNELS - 1);
+            return 1;
+        }
         /* Single source from CLI args */
         strncpy(single_source.key, key, sizeof(single_source.key) - 1);
         single_source.address = address;
@@ -402,6 +868,21 @@ int cmd_fuse(int argc, char **argv) {
         }
     }
     
+    /* Without streaming, cmg-cli prints one sample and exits, so every sample
+     * costs a new cmg-cli process. One long-lived stream is much cheaper. */
+    int has_stream_flag = 0;
+    for (int i = 0; i < fuse_arg_count; i++) {
+        if (strcmp(fuse_args[i], "--stream") == 0 || strcmp(fuse_args[i], "-s") == 0 ||
+            strncmp(fuse_args[i], "--stream=", 9) == 0) {
+            has_stream_flag = 1;
+            break;
+        }
+    }
+    if (!has_stream_flag) {
+        fprintf(stderr, "Warning: No --stream/-s in cmg-cli arguments; "
+                        "cmg-cli will exit after a single sample\n");
+    }
+
     /* Build final args, adding --json if needed */
     char **final_args = NULL;
     int final_arg_count = fuse_arg_count;
@@ -419,9 +900,13 @@ int cmd_fuse(int argc, char **argv) {
     }
     
     /* Create and run bridge */
-    FuseBridge *bridge = bridge_create(sources, source_count, final_args, final_arg_count, time_format);
-    int exit_code = bridge_run(bridge);
-    bridge_free(bridge);
+    FuseBridge *bridge = bridge_create(sources, source_count, final_args, final_arg_count,
+                                       time_format, min_interval);
+    int exit_code = 1;
+    if (bridge) {
+        exit_code = bridge_run(bridge);
+        bridge_free(bridge);
+    }
     
     /* Free allocated args array if we created one */
     if (!has_json_flag) {
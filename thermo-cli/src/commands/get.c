@@ -129,7 +129,11 @@ static int collect_channels(ThermalSource *sources, int source_count, CollectedD
         collected_data_free(out);
         return THERMO_ERROR;
     }
-    board_manager_configure(mgr_out);
+    board_manager_set_calibration(mgr_out);
+    /* TC types only matter for temp/adc reads; metadata queries skip the writes */
+    if (get_temp || get_adc) {
+        board_manager_set_tc_types(mgr_out);
+    }
     
     DEBUG_PRINT("Beginning data collection for %d sources", source_count);
     
@@ -251,7 +255,10 @@ static int stream_channels(ThermalSource *sources, int source_count,
     if (board_manager_init(&mgr, sources, source_count) != THERMO_SUCCESS) {
         return 1;
     }
-    board_manager_configure(&mgr);
+    board_manager_set_calibration(&mgr);
+    if (get_temp || get_adc) {
+        board_manager_set_tc_types(&mgr);
+    }
     
     /* Collect static board info ONCE */
     if (get_serial || get_cal_date || get_cal_coeffs || get_interval) {
@@ -336,17 +343,27 @@ static int stream_channels(ThermalSource *sources, int source_count,
         }
     }
     
+    /* Boards stay open for the whole stream; the readings buffer and the
+     * source key width are set up once and reused on every tick */
+    ChannelReading *readings = calloc(source_count, sizeof(ChannelReading));
+    if (!readings) {
+        fprintf(stderr, "Error: Failed to allocate memory\n");
+        board_manager_close(&mgr);
+        return 1;
+    }
+    
+    int max_key_len = 0;
+    for (int i = 0; i < source_count; i++) {
+        if (sources[i].key[0] != '\0') {
+            int len = strlen(sources[i].key);
+            if (len > max_key_len) max_key_len = len;
+        }
+    }
+    
     signals_install_handlers();
     
     /* Streaming loop - only dynamic readings */
     while (g_running) {
-        ChannelReading *readings = calloc(source_count, sizeof(ChannelReading));
-        if (!readings) {
-            fprintf(stderr, "Error: Failed to allocate memory\n");
-            board_manager_close(&mgr);
-            return 1;
-        }
-        
         /* Collect dynamic data only */
         for (int i = 0; i < source_count; i++) {
             channel_reading_collect(&readings[i],
@@ -361,26 +378,18 @@ static int stream_channels(ThermalSource *sources, int source_count,
         } else {
             if (source_count == 1) {
                 /* Calculate formatting widths for single reading */
-                int max_key_len = 0, max_value_width = 0, max_unit_len = 0;
+                int max_data_key_len = 0, max_value_width = 0, max_unit_len = 0;
                 reading_format_calculate_max_width(readings, NULL, sources, 1,
-                                                  &max_key_len, &max_value_width, &max_unit_len);
+                                                  &max_data_key_len, &max_value_width, &max_unit_len);
                 
                 /* Use formatting helper for dynamic data only */
-                reading_format_output(&readings[0], NULL, &sources[0], 4, max_key_len, max_value_width, max_unit_len,
+                reading_format_output(&readings[0], NULL, &sources[0], 4, max_data_key_len, max_value_width, max_unit_len,
                                      0, 0, 0, 0);
                 if (!clean_mode) {
                     printf("----------------------------------------\n");
                 }
             } else {
                 /* Multi-channel streaming output */
-                int max_key_len = 0;
-                for (int i = 0; i < source_count; i++) {
-                    if (sources[i].key[0] != '\0') {
-                        int len = strlen(sources[i].key);
-                        if (len > max_key_len) max_key_len = len;
-                    }
-                }
-                
                 /* Calculate formatting widths */
                 int max_data_key_len = 0, max_value_width = 0, max_unit_len = 0;
                 reading_format_calculate_max_width(readings, NULL, sources, source_count,
@@ -410,10 +419,10 @@ static int stream_channels(ThermalSource *sources, int source_count,
             }
         }
         
-        free(readings);
         nanosleep(&sleep_time, NULL);
     }
     
+    free(readings);
     board_manager_close(&mgr);
     return 0;
 }
@@ -477,6 +486,11 @@ int cmd_get(int argc, char **argv) {
         }
     }
     
+    /* Piped or redirected output is read by scripts: skip the decorations */
+    if (!json_output && !isatty(STDOUT_FILENO)) {
+        clean_mode = 1;
+    }
+    
     /* Default to temperature if nothing specified */
     if (!get_serial && !get_cal_date && !get_cal_coeffs && 
         !get_temp && !get_adc && !get_cjc && !get_interval) {
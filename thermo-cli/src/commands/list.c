@@ -6,6 +6,7 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <getopt.h>
+#include <unistd.h>
 #include <daqhats/daqhats.h>
 
 #include "commands/list.h"
@@ -17,25 +18,35 @@
 /* Command: list - List all connected MCC 134 boards */
 int cmd_list(int argc, char **argv) {
     int json_output = 0;
+    int clean_mode = 0;
     
     /* Parse options */
     static struct option long_options[] = {
         {"json", no_argument, 0, 'j'},
+        {"clean", no_argument, 0, 'l'},
         {0, 0, 0, 0}
     };
     
     int opt;
-    while ((opt = getopt_long(argc, argv, "j", long_options, NULL)) != -1) {
+    while ((opt = getopt_long(argc, argv, "jl", long_options, NULL)) != -1) {
         switch (opt) {
             case 'j':
                 json_output = 1;
                 break;
+            case 'l':
+                clean_mode = 1;
+                break;
             default:
-                fprintf(stderr, "Usage: thermo-cli list [--json]\n");
+                fprintf(stderr, "Usage: thermo-cli list [--json] [--clean]\n");
                 return 1;
         }
     }
     
+    /* Piped or redirected output is read by scripts: skip the table */
+    if (!json_output && !isatty(STDOUT_FILENO)) {
+        clean_mode = 1;
+    }
+    
     struct HatInfo *boards = NULL;
     int count = 0;
     
@@ -62,6 +73,11 @@ int cmd_list(int argc, char **argv) {
         printf("%s\n", json_str);
         free(json_str);
         cJSON_Delete(root);
+    } else if (clean_mode) {
+        /* One tab-separated line per board: address, ID, name */
+        for (int i = 0; i < count; i++) {
+            printf("%d\tMCC 134\t%s\n", boards[i].address, boards[i].product_name);
+        }
     } else {
         if (count == 0) {
             printf("No MCC 134 boards detected.\n");
@@ -10,6 +10,7 @@
 
 #include "common.h"
 #include "hardware.h"
+#include "board_manager.h"
 
 #include "cJSON.h"
 
@@ -135,6 +136,14 @@ static int load_json_config(const char *path, Config *config) {
             continue;
         }
 
+        /* Checked before narrowing to uint8_t, so large values cannot wrap into range */
+        if (addr_item->valueint < 0 || addr_item->valueint >= MAX_BOARDS ||
+            chan_item->valueint < 0 || chan_item->valueint >= MCC134_NUM_CHANNELS) {
+            fprintf(stderr, "Warning: Source %d has invalid address/channel (%d/%d), skipping\n",
+                    i, addr_item->valueint, chan_item->valueint);
+            continue;
+        }
+
         ThermalSource *ts = &config->sources[config->source_count];
         
         if (key_item && cJSON_IsString(key_item)) {
@@ -211,6 +220,9 @@ static int load_yaml_config(const char *path, Config *config) {
     ThermalSource current_source = {0};
     char current_key[64] = {0};
     int expecting_value = 0;
+    int source_index = 0;
+    int address_value = 0;
+    int channel_value = 0;
     
     /* Initialize defaults for current source */
     current_source.cal_coeffs.slope = DEFAULT_CALIBRATION_SLOPE;
@@ -239,9 +251,11 @@ static int load_yaml_config(const char *path, Config *config) {
                     if (strcmp(current_key, "key") == 0) {
                         strncpy(current_source.key, (char*)event.data.scalar.value, sizeof(current_source.key) - 1);
                     } else if (strcmp(current_key, "address") == 0) {
-                        current_source.address = (uint8_t)atoi((char*)event.data.scalar.value);
+                        address_value = atoi((char*)event.data.scalar.value);
+                        current_source.address = (uint8_t)address_value;
                     } else if (strcmp(current_key, "channel") == 0) {
-                        current_source.channel = (uint8_t)atoi((char*)event.data.scalar.value);
+                        channel_value = atoi((char*)event.data.scalar.value);
+                        current_source.channel = (uint8_t)channel_value;
                     } else if (strcmp(current_key, "tc_type") == 0) {
                         strncpy(current_source.tc_type, (char*)event.data.scalar.value, sizeof(current_source.tc_type) - 1);
                     } else if (strcmp(current_key, "cal_slope") == 0) {
@@ -266,6 +280,8 @@ static int load_yaml_config(const char *path, Config *config) {
                 if (in_sources) {
                     in_source_item = 1;
                     memset(&current_source, 0, sizeof(current_source));
+                    address_value = 0;
+                    channel_value = 0;
                     /* Initialize defaults for new source */
                     current_source.cal_coeffs.slope = DEFAULT_CALIBRATION_SLOPE;
                     current_source.cal_coeffs.offset = DEFAULT_CALIBRATION_OFFSET;
@@ -276,6 +292,16 @@ static int load_yaml_config(const char *path, Config *config) {
 
             case YAML_MAPPING_END_EVENT:
                 if (in_source_item) {
+                    /* Skip sources whose address/channel would wrap or overrun the board tables */
+                    if (address_value < 0 || address_value >= MAX_BOARDS ||
+                        channel_value < 0 || channel_value >= MCC134_NUM_CHANNELS) {
+                        fprintf(stderr, "Warning: Source %d has invalid address/channel (%d/%d), skipping\n",
+                                source_index++, address_value, channel_value);
+                        in_source_item = 0;
+                        break;
+                    }
+                    source_index++;
+                    
                     /* Add completed source */
                     if (config->source_count >= max_sources) {
                         max_sources *= 2;
@@ -340,6 +366,64 @@ void config_free(Config *config) {
     }
 }
 
+/* Example configurations written by config_create_example */
+static const char EXAMPLE_CONFIG_JSON[] =
+    "{\n"
+    "  \"sources\": [\n"
+    "    {\n"
+    "      \"key\": \"BATTERY_TEMP\",\n"
+    "      \"address\": 0,\n"
+    "      \"channel\": 0,\n"
+    "      \"tc_type\": \"K\",\n"
+    "      \"cal_slope\": 1.0,\n"
+    "      \"cal_offset\": 0.0,\n"
+    "      \"update_interval\": 1\n"
+    "    },\n"
+    "    {\n"
+    "      \"key\": \"MOTOR_TEMP\",\n"
+    "      \"address\": 0,\n"
+    "      \"channel\": 1,\n"
+    "      \"tc_type\": \"K\",\n"
+    "      \"cal_slope\": 1.0,\n"
+    "      \"cal_offset\": 0.0,\n"
+    "      \"update_interval\": 1\n"
+    "    },\n"
+    "    {\n"
+    "      \"key\": \"AMBIENT_TEMP\",\n"
+    "      \"address\": 0,\n"
+    "      \"channel\": 2,\n"
+    "      \"tc_type\": \"K\",\n"
+    "      \"cal_slope\": 1.0,\n"
+    "      \"cal_offset\": 0.0,\n"
+    "      \"update_interval\": 1\n"
+    "    }\n"
+    "  ]\n"
+    "}\n";
+
+static const char EXAMPLE_CONFIG_YAML[] =
+    "sources:\n"
+    "- key: BATTERY_TEMP\n"
+    "  address: 0\n"
+    "  channel: 0\n"
+    "  tc_type: K\n"
+    "  cal_slope: 1.0\n"
+    "  cal_offset: 0.0\n"
+    "  update_interval: 1\n"
+    "- key: MOTOR_TEMP\n"
+    "  address: 0\n"
+    "  channel: 1\n"
+    "  tc_type: K\n"
+    "  cal_slope: 1.0\n"
+    "  cal_offset: 0.0\n"
+    "  update_interval: 1\n"
+    "- key: AMBIENT_TEMP\n"
+    "  address: 0\n"
+    "  channel: 2\n"
+    "  tc_type: K\n"
+    "  cal_slope: 1.0\n"
+    "  cal_offset: 0.0\n"
+    "  update_interval: 1\n";
+
 /* Create example configuration file */
 int config_create_example(const char *output_path) {
     if (output_path == NULL) {
@@ -356,65 +440,12 @@ int config_create_example(const char *output_path) {
         return THERMO_IO_ERROR;
     }
 
-    if (is_json) {
-        /* Write JSON example */
-        fprintf(fp, "{\n");
-        fprintf(fp, "  \"sources\": [\n");
-        fprintf(fp, "    {\n");
-        fprintf(fp, "      \"key\": \"BATTERY_TEMP\",\n");
-        fprintf(fp, "      \"address\": 0,\n");
-        fprintf(fp, "      \"channel\": 0,\n");
-        fprintf(fp, "      \"tc_type\": \"K\",\n");
-        fprintf(fp, "      \"cal_slope\": 1.0,\n");
-        fprintf(fp, "      \"cal_offset\": 0.0,\n");
-        fprintf(fp, "      \"update_interval\": 1\n");
-        fprintf(fp, "    },\n");
-        fprintf(fp, "    {\n");
-        fprintf(fp, "      \"key\": \"MOTOR_TEMP\",\n");
-        fprintf(fp, "      \"address\": 0,\n");
-        fprintf(fp, "      \"channel\": 1,\n");
-        fprintf(fp, "      \"tc_type\": \"K\",\n");
-        fprintf(fp, "      \"cal_slope\": 1.0,\n");
-        fprintf(fp, "      \"cal_offset\": 0.0,\n");
-        fprintf(fp, "      \"update_interval\": 1\n");
-        fprintf(fp, "    },\n");
-        fprintf(fp, "    {\n");
-        fprintf(fp, "      \"key\": \"AMBIENT_TEMP\",\n");
-        fprintf(fp, "      \"address\": 0,\n");
-        fprintf(fp, "      \"channel\": 2,\n");
-        fprintf(fp, "      \"tc_type\": \"K\",\n");
-        fprintf(fp, "      \"cal_slope\": 1.0,\n");
-        fprintf(fp, "      \"cal_offset\": 0.0,\n");
-        fprintf(fp, "      \"update_interval\": 1\n");
-        fprintf(fp, "    }\n");
-        fprintf(fp, "  ]\n");
-        fprintf(fp, "}\n");
-    } else {
-        /* Write YAML example */
-        fprintf(fp, "sources:\n");
-        fprintf(fp, "- key: BATTERY_TEMP\n");
-        fprintf(fp, "  address: 0\n");
-        fprintf(fp, "  channel: 0\n");
-        fprintf(fp, "  tc_type: K\n");
-        fprintf(fp, "  cal_slope: 1.0\n");
-        fprintf(fp, "  cal_offset: 0.0\n");
-        fprintf(fp, "  update_interval: 1\n");
-        fprintf(fp, "- key: MOTOR_TEMP\n");
-        fprintf(fp, "  address: 0\n");
-        fprintf(fp, "  channel: 1\n");
-        fprintf(fp, "  tc_type: K\n");
-        fprintf(fp, "  cal_slope: 1.0\n");
-        fprintf(fp, "  cal_offset: 0.0\n");
-        fprintf(fp, "  update_interval: 1\n");
-        fprintf(fp, "- key: AMBIENT_TEMP\n");
-        fprintf(fp, "  address: 0\n");
-        fprintf(fp, "  channel: 2\n");
-        fprintf(fp, "  tc_type: K\n");
-        fprintf(fp, "  cal_slope: 1.0\n");
-        fprintf(fp, "  cal_offset: 0.0\n");
-        fprintf(fp, "  update_interval: 1\n");
-    }
+    /* Write the whole example in one call */
+    fputs(is_json ? EXAMPLE_CONFIG_JSON : EXAMPLE_CONFIG_YAML, fp);
 
-    fclose(fp);
+    if (fclose(fp) != 0) {
+        fprintf(stderr, "Error: Could not write config file: %s\n", output_path);
+        return THERMO_IO_ERROR;
+    }
     return THERMO_SUCCESS;
 }
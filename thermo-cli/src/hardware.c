@@ -17,16 +17,16 @@
 #include "hardware.h"
 #include "utils.h"
 
+/* Type letters indexed by their TC_TYPE_* value (J=0 ... N=7) */
+static const char TC_TYPE_LETTERS[] = "JKTERSBN";
+
 /* Convert string to TC type enum */
 uint8_t thermo_tc_type_from_string(const char *tc_type_str) {
-    if (strcmp(tc_type_str, "K") == 0) return TC_TYPE_K;
-    if (strcmp(tc_type_str, "J") == 0) return TC_TYPE_J;
-    if (strcmp(tc_type_str, "T") == 0) return TC_TYPE_T;
-    if (strcmp(tc_type_str, "E") == 0) return TC_TYPE_E;
-    if (strcmp(tc_type_str, "R") == 0) return TC_TYPE_R;
-    if (strcmp(tc_type_str, "S") == 0) return TC_TYPE_S;
-    if (strcmp(tc_type_str, "B") == 0) return TC_TYPE_B;
-    if (strcmp(tc_type_str, "N") == 0) return TC_TYPE_N;
+    /* All valid types are a single letter; index it directly */
+    if (tc_type_str[0] != '\0' && tc_type_str[1] == '\0') {
+        const char *match = strchr(TC_TYPE_LETTERS, tc_type_str[0]);
+        if (match) return (uint8_t)(match - TC_TYPE_LETTERS);
+    }
     return TC_DISABLED;
 }
 
@@ -137,37 +137,36 @@ int thermo_set_tc_type(uint8_t address, uint8_t channel, const char *tc_type_str
         return THERMO_INVALID_PARAM;
     }
 
-    int result = mcc134_tc_type_write(address, channel, tc_type);
-    return (result == RESULT_SUCCESS) ? THERMO_SUCCESS : THERMO_ERROR;
-}
-/* Read temperature from channel (board must be open, tc_type must be set) */
-int thermo_read_temp(uint8_t address, uint8_t channel, double *value) {
-    if (value == NULL || channel > 3) {
-        return THERMO_INVALID_PARAM;
+    /* Skip the write if the channel is already configured with this type */
+    uint8_t current_type;
+    if (mcc134_tc_type_read(address, channel, &current_type) == RESULT_SUCCESS &&
+        current_type == tc_type) {
+        return THERMO_SUCCESS;
     }
 
-    int result = mcc134_t_in_read(address, channel, value);
+    int result = mcc134_tc_type_write(address, channel, tc_type);
     return (result == RESULT_SUCCESS) ? THERMO_SUCCESS : THERMO_ERROR;
 }
 
-/* Read ADC voltage from channel (board must be open, tc_type must be set) */
-int thermo_read_adc(uint8_t address, uint8_t channel, double *value) {
-    if (value == NULL || channel > 3) {
-        return THERMO_INVALID_PARAM;
+/*
+ * Read temperatures of several channels back-to-back (board must be open).
+ * Bit n of channel_mask selects channel n; values is indexed by channel and
+ * must hold MCC134_NUM_CHANNELS entries.
+ * Returns a mask of the channels that were read successfully.
+ */
+uint8_t thermo_read_temp_all(uint8_t address, uint8_t channel_mask, double *values) {
+    uint8_t ok_mask = 0;
+    if (values == NULL) {
+        return 0;
     }
 
-    int result = mcc134_a_in_read(address, channel, OPTS_DEFAULT, value);
-    return (result == RESULT_SUCCESS) ? THERMO_SUCCESS : THERMO_ERROR;
-}
-
-/* Read CJC temperature from channel (board must be open) */
-int thermo_read_cjc(uint8_t address, uint8_t channel, double *value) {
-    if (value == NULL || channel > 3) {
-        return THERMO_INVALID_PARAM;
+    for (uint8_t channel = 0; channel < MCC134_NUM_CHANNELS; channel++) {
+        if ((channel_mask & (1 << channel)) &&
+            mcc134_t_in_read(address, channel, &values[channel]) == RESULT_SUCCESS) {
+            ok_mask |= (1 << channel);
+        }
     }
-
-    int result = mcc134_cjc_read(address, channel, value);
-    return (result == RESULT_SUCCESS) ? THERMO_SUCCESS : THERMO_ERROR;
+    return ok_mask;
 }
 
 /* Wait for readings to stabilize after setting TC type */
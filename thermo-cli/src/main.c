@@ -76,6 +76,7 @@ static void print_command_help(const char *cmd_name) {
         printf("Usage: thermo-cli list [OPTIONS]\n\n");
         printf("List all connected MCC 134 boards.\n\n");
         printf("Options:\n");
+        printf("  -l, --clean         One tab-separated line per board (default when not a terminal)\n");
         printf("  -j, --json          Output as JSON\n");
     } else if (strcmp(cmd_name, "get") == 0) {
         printf("Usage: thermo-cli get [OPTIONS]\n\n");
@@ -97,7 +98,7 @@ static void print_command_help(const char *cmd_name) {
         printf("  -J, --cjc                Get CJC temperature\n");
         printf("  -i, --update-interval    Get update interval\n");
         printf("  -S, --stream HZ          Stream readings at specified frequency (Hz)\n");
-        printf("  -l, --clean              Simple output without alignment/formatting\n");
+        printf("  -l, --clean              Simple output without alignment/formatting (default when not a terminal)\n");
         printf("  -j, --json               Output as JSON\n\n");
         printf("Notes:\n");
         printf("  - Cannot specify both --config and --address/--channel\n");
@@ -128,6 +129,8 @@ static void print_command_help(const char *cmd_name) {
         printf("  -t, --tc-type TYPE     Thermocouple type (default: K)\n");
         printf("  -T, --time-format FMT  Timestamp format (default: %%Y-%%m-%%dT%%H:%%M:%%S.%%f)\n");
         printf("                         Use %%f for 6-digit microseconds\n");
+        printf("  -I, --min-interval SEC Minimum seconds between thermal reads (default: 0.05)\n");
+        printf("                         Output lines arriving faster reuse the last reading\n");
         printf("Examples:\n");
         printf("  thermo-cli fuse --address 0 --channel 1 --key MY_TEMP -- --power --json\n");
         printf("  thermo-cli fuse --config config.yaml -- --actuator --stream 5 --json\n");